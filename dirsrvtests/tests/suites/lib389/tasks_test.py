@@ -0,0 +1,403 @@
+# --- BEGIN COPYRIGHT BLOCK ---
+# Copyright (C) 2021 Red Hat, Inc.
+# All rights reserved.
+#
+# License: GPL (version 3 or any later version).
+# See LICENSE for details.
+# --- END COPYRIGHT BLOCK ---
+#
+import os
+import threading
+import ldap
+import pytest
+from lib389._constants import DEFAULT_SUFFIX, DN_TASKS
+from lib389.backend import Backends
+from lib389.idm.user import UserAccount
+from lib389.properties import TASK_WAIT, TASK_DEFER_ADD
+from lib389.replica import ReplicationManager
+from lib389.tasks import Task, TaskConnectionPool, SchemaReloadTask
+from lib389.topologies import topology_st as topo
+
+pytestmark = pytest.mark.tier1
+
+
+@pytest.mark.parametrize("psearch", [True, False])
+def test_task_wait(topo, monkeypatch, psearch):
+    """Check that Task.wait() returns once the task is complete, with and
+    without a persistent search
+
+    :id: 3a471aca-58e5-4753-a3e2-a63d532c93cc
+    :parametrized: yes
+    :setup: Standalone instance
+    :steps:
+        1. Make Task.wait() use only the persistent search, or only polling
+        2. Start a schema reload task and wait for it
+    :expectedresults:
+        1. Success
+        2. The task is complete with exit code 0 when wait() returns
+    """
+
+    inst = topo.standalone
+    if psearch:
+        assert inst.rootdse.supports_psearch()
+
+        def _no_poll(self, deadline):
+            pytest.fail('Task.wait() polled the task')
+
+        monkeypatch.setattr(Task, '_wait_poll', _no_poll)
+    else:
+        monkeypatch.setattr(inst.rootdse, 'supports_psearch', lambda: False)
+
+    task = SchemaReloadTask(inst)
+    task.create(properties={})
+    task.wait(timeout=120)
+    assert task.is_complete()
+    assert task.get_exit_code() == 0
+
+
+def test_backend_cache_follows_backend_changes(topo):
+    """Check that the task backend lookups, on the instance and on the
+    task_pool connections, see backends added and deleted
+
+    :id: 5dcf6e0c-d2b6-431f-a840-7eecd434c969
+    :setup: Standalone instance
+    :steps:
+        1. Start a tombstone fixup task on a backend that does not exist,
+           directly and through run_tasks()
+        2. Create the backend and start the task again, both ways
+        3. Delete the backend and start the task again, both ways
+    :expectedresults:
+        1. ValueError is raised
+        2. The tasks are added and complete
+        3. ValueError is raised
+    """
+
+    inst = topo.standalone
+    spec = [('fixupTombstones', {'bename': 'tasks_test', 'args': {TASK_WAIT: True}})]
+    with pytest.raises(ValueError):
+        inst.tasks.fixupTombstones(bename='tasks_test')
+    with pytest.raises(ValueError):
+        inst.tasks.run_tasks(spec)
+
+    backend = Backends(inst).create(properties={'cn': 'tasks_test',
+                                                'nsslapd-suffix': 'o=tasks_test'})
+    try:
+        # Wait for the tasks, so that the backend is not deleted under them
+        inst.tasks.fixupTombstones(bename='tasks_test', args={TASK_WAIT: True})
+        assert inst.tasks.task.is_complete()
+        assert inst.tasks.run_tasks(spec) == [0]
+    finally:
+        backend.delete()
+
+    with pytest.raises(ValueError):
+        inst.tasks.fixupTombstones(bename='tasks_test')
+    with pytest.raises(ValueError):
+        inst.tasks.run_tasks(spec)
+
+
+def test_batch(topo):
+    """Check that batch() queues the task entries and adds them at the
+    end of the block
+
+    :id: 9b4347dd-b8d0-4cfa-8368-f0963ff8acbd
+    :setup: Standalone instance
+    :steps:
+        1. Queue two reindex tasks in a batch
+        2. Wait for the queued tasks
+    :expectedresults:
+        1. Both entries are added when the block ends
+        2. Both tasks complete with exit code 0
+    """
+
+    inst = topo.standalone
+    with inst.tasks.batch() as queued:
+        inst.tasks.reindex(suffix=DEFAULT_SUFFIX, attrname='cn')
+        inst.tasks.reindex(suffix=DEFAULT_SUFFIX, attrname='sn')
+    assert len(queued) == 2
+    for entry in queued:
+        done, exit_code, _ = inst.tasks.checkTask(entry, dowait=True, timeout=120)
+        assert done and exit_code == 0
+
+
+def test_check_task_and_progress(topo):
+    """Check the checkTask() backoff parameters and get_progress()
+
+    :id: 9d96e145-b25e-4b55-9919-c0c0b5fc71dc
+    :setup: Standalone instance
+    :steps:
+        1. Start a syntax validate task without waiting for it
+        2. Wait for it with checkTask() and a short backoff
+        3. Read its progress
+    :expectedresults:
+        1. Success
+        2. The task is done with exit code 0
+        3. The status and log of the task are returned
+    """
+
+    inst = topo.standalone
+    assert inst.tasks.syntaxValidate(suffix=DEFAULT_SUFFIX) == 0
+    entry = inst.tasks.entry
+
+    done, exit_code, _ = inst.tasks.checkTask(entry, dowait=True, timeout=120,
+                                              initial=0.01, factor=2, cap=0.5)
+    assert done
+    assert exit_code == 0
+
+    progress = inst.tasks.get_progress(entry)
+    assert set(progress) == {'status', 'log', 'current', 'total'}
+    assert progress['status'] is not None
+
+
+@pytest.mark.parametrize("psearch", [True, False])
+def test_check_task_persistent(topo, monkeypatch, psearch):
+    """Check that checkTaskPersistent() waits for the task, whether the
+    server supports persistent searches or not
+
+    :id: 22898d18-6b7e-496e-a6dc-dec1f1579a2b
+    :parametrized: yes
+    :setup: Standalone instance
+    :steps:
+        1. Make the instance report persistent search support, or not
+        2. Start a syntax validate task without waiting for it
+        3. Wait for it with checkTaskPersistent()
+    :expectedresults:
+        1. Success
+        2. Success
+        3. The task is done with exit code 0
+    """
+
+    inst = topo.standalone
+    monkeypatch.setattr(inst.rootdse, 'supports_psearch', lambda: psearch)
+    assert inst.tasks.syntaxValidate(suffix=DEFAULT_SUFFIX) == 0
+
+    done, exit_code, _ = inst.tasks.checkTaskPersistent(inst.tasks.entry, timeout=120)
+    assert done
+    assert exit_code == 0
+
+
+def _whoami_within(pool, timeout=30):
+    """Return whoami through a connection of pool, failing the test if
+    none is free within timeout seconds"""
+
+    result = []
+
+    def _run():
+        with pool.acquire() as conn:
+            result.append(conn.whoami_s())
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        pytest.fail('No connection of the pool was given back')
+    assert result
+    return result[0]
+
+
+def test_task_pool_recovers_after_errors(topo):
+    """Check that the task connection pool gets its connections back when
+    the code using them fails
+
+    :id: 61fd85b1-4e87-4602-9b2b-ae39aef4f015
+    :setup: Standalone instance
+    :steps:
+        1. Create a pool of one connection
+        2. Raise LDAP errors and a KeyError while holding the connection,
+           more times than the pool size
+        3. Borrow a connection again
+        4. Raise SERVER_DOWN while holding the connection
+        5. Borrow a connection again
+        6. Borrow a connection from a pool of size 0
+    :expectedresults:
+        1. Success
+        2. The errors are raised to the caller
+        3. The connection is free and works
+        4. The error is raised to the caller
+        5. A new connection is opened, and it works
+        6. The instance itself is handed out
+    """
+
+    inst = topo.standalone
+    missing_dn = 'uid=tasks_test_missing,ou=people,{}'.format(DEFAULT_SUFFIX)
+    pool = TaskConnectionPool(inst, size=1)
+    try:
+        for _ in range(3):
+            with pytest.raises(ldap.NO_SUCH_OBJECT):
+                with pool.acquire() as conn:
+                    UserAccount(conn, missing_dn).get_attr_val_utf8('uid')
+            with pytest.raises(KeyError):
+                with pool.acquire() as conn:
+                    raise KeyError('uid')
+        assert _whoami_within(pool)
+
+        with pytest.raises(ldap.SERVER_DOWN):
+            with pool.acquire() as conn:
+                lost = conn
+                raise ldap.SERVER_DOWN({'desc': "Can't contact LDAP server"})
+        with pool.acquire() as conn:
+            assert conn is not lost
+        assert _whoami_within(pool)
+    finally:
+        pool.close()
+
+    with TaskConnectionPool(inst, size=0).acquire() as conn:
+        assert conn is inst
+
+
+@pytest.fixture(scope="module")
+def supplier(topo, request):
+    """The standalone instance, with replication enabled on the suffix"""
+
+    inst = topo.standalone
+    repl = ReplicationManager(DEFAULT_SUFFIX)
+    repl.create_first_supplier(inst)
+    request.addfinalizer(lambda: repl.remove_supplier(inst))
+    return inst
+
+
+def _check_cleanallruv(inst, rids, results):
+    """Check that results holds, in order, one completed cleanAllRUV task
+    per replica id of rids"""
+
+    assert len(results) == len(rids)
+    for rid, (dn, exit_code) in zip(rids, results):
+        assert exit_code == 0
+        task = Task(inst, dn)
+        assert task.is_complete()
+        assert task.get_exit_code() == 0
+        assert task.get_attr_val_utf8('replica-id') == rid
+
+
+def test_cleanallruv_many(supplier):
+    """Check that cleanAllRUV_many() runs one task per replica id, and
+    returns the dn and exit code of each one
+
+    :id: bae4f757-bddf-400f-8d3b-126efb9d26e8
+    :setup: Standalone instance, with replication enabled on the suffix
+    :steps:
+        1. Force clean three replica ids with cleanAllRUV_many(), waiting
+           for the tasks
+        2. Pass an item without a replica id
+    :expectedresults:
+        1. One (task dn, 0) tuple is returned per replica id, in order,
+           and each dn is the completed task of that replica id
+        2. ValueError is raised
+    """
+
+    rids = ('21', '22', '23')
+    results = supplier.tasks.cleanAllRUV_many([(DEFAULT_SUFFIX, rid, True) for rid in rids],
+                                              wait=True, timeout=120)
+    _check_cleanallruv(supplier, rids, results)
+
+    with pytest.raises(ValueError):
+        supplier.tasks.cleanAllRUV_many([(DEFAULT_SUFFIX, '31', True),
+                                         (DEFAULT_SUFFIX, None, True)])
+
+
+def test_defer_add(topo):
+    """Check that tasks started with the defer-add arg are added, and
+    that collect_acks() reads their replies
+
+    :id: 372b3d40-a09d-4cea-b4df-a3af41d38064
+    :setup: Standalone instance
+    :steps:
+        1. Start syntax validate tasks with the defer-add arg
+        2. Collect the add replies
+        3. Wait for the tasks
+    :expectedresults:
+        1. Success
+        2. No reply is left
+        3. The tasks complete with exit code 0
+    """
+
+    inst = topo.standalone
+    dns = []
+    for _ in range(3):
+        assert inst.tasks.syntaxValidate(suffix=DEFAULT_SUFFIX,
+                                         args={TASK_DEFER_ADD: True}) == 0
+        dns.append(inst.tasks.dn)
+    inst.tasks.collect_acks()
+    assert not inst.tasks._unacked
+    for dn in dns:
+        task = Task(inst, dn)
+        task.wait(timeout=120)
+        assert task.get_exit_code() == 0
+
+
+def _count_tasks(inst, container):
+    return len(inst.search_ext_s(container, ldap.SCOPE_ONELEVEL, attrlist=['cn'],
+                                 escapehatch='i am sure'))
+
+
+def test_run_tasks_mixed_batch(topo, monkeypatch):
+    """Check that run_tasks() starts nothing when a spec is invalid, and
+    that a failing task does not hold on to its pool connection
+
+    :id: f63d8b91-dac2-4a3b-a310-8d349f6c0351
+    :setup: Standalone instance
+    :steps:
+        1. Run a batch of valid syntaxValidate specs and one unknown method
+        2. Run a batch of valid syntaxValidate specs and a checkTask spec
+        3. Run a batch with a fixupTombstones task on a missing backend
+        4. Run a batch of valid syntaxValidate specs, waiting for them
+        5. Disable the task pool, and run the same batch
+    :expectedresults:
+        1. ValueError is raised, and no syntax validate task was added
+        2. Same as 1
+        3. ValueError is raised
+        4. One exit code 0 per spec is returned
+        5. Same as 4
+    """
+
+    inst = topo.standalone
+    syntax_validate_dn = 'cn=syntax validate,{}'.format(DN_TASKS)
+    valid = [('syntaxValidate', {'suffix': DEFAULT_SUFFIX, 'args': {TASK_WAIT: True}})
+             for _ in range(4)]
+    before = _count_tasks(inst, syntax_validate_dn)
+
+    for invalid in (('noSuchTask', {}), ('checkTask', {'entry': None})):
+        with pytest.raises(ValueError):
+            inst.tasks.run_tasks(valid + [invalid])
+        assert _count_tasks(inst, syntax_validate_dn) == before
+
+    with pytest.raises(ValueError):
+        inst.tasks.run_tasks([('fixupTombstones', {'bename': 'no_such_backend'})] * 8,
+                             pool_size=4)
+
+    assert inst.tasks.run_tasks(valid, pool_size=4) == [0] * len(valid)
+
+    monkeypatch.setattr(inst, 'task_pool', TaskConnectionPool(inst, size=0))
+    assert inst.tasks.run_tasks(valid, pool_size=4) == [0] * len(valid)
+
+
+def test_cleanallruv_parallel(supplier):
+    """Check that cleanAllRUV_parallel() runs one task per replica id, and
+    returns the dn and exit code of each one
+
+    :id: fc09fc89-4ba4-4d96-9a93-757b0fe88b1b
+    :setup: Standalone instance, with replication enabled on the suffix
+    :steps:
+        1. Force clean three replica ids with cleanAllRUV_parallel(),
+           waiting for the tasks
+        2. Pass an entry without a replica id
+    :expectedresults:
+        1. One (task dn, 0) tuple is returned per replica id, in order,
+           and each dn is the completed task of that replica id
+        2. ValueError is raised
+    """
+
+    rids = ('11', '12', '13')
+    results = supplier.tasks.cleanAllRUV_parallel([(DEFAULT_SUFFIX, rid, True) for rid in rids],
+                                                  args={TASK_WAIT: True})
+    _check_cleanallruv(supplier, rids, results)
+
+    with pytest.raises(ValueError):
+        supplier.tasks.cleanAllRUV_parallel([(DEFAULT_SUFFIX, '31', True),
+                                             (DEFAULT_SUFFIX, None, True)])
+
+
+if __name__ == '__main__':
+    # Run isolated
+    # -s for DEBUG mode
+    CURRENT_FILE = os.path.realpath(__file__)
+    pytest.main("-s %s" % CURRENT_FILE)
@@ -6,16 +6,37 @@ import ldap
 from lib389._constants import DEFAULT_SUFFIX
 
 
-def get_repl_entries(topo, entry_name, attr_list):
-    """Get a list of test entries from all suppliers"""
+def get_repl_entries(topo, entry_name, attr_list, executor=None):
+    """Get a list of test entries from all suppliers
 
-    entries_list = []
+    Every instance has its own connection, so when an executor is given
+    the instances are searched concurrently on it.
+    """
+
+    insts = topo.all_insts.values()
 
-    time.sleep(10)
+    def _search(inst):
+        return inst.search_s(DEFAULT_SUFFIX, ldap.SCOPE_SUBTREE,
+                             "uid={}".format(entry_name), attr_list)
 
-    for inst in topo.all_insts.values():
-        entries = inst.search_s(DEFAULT_SUFFIX, ldap.SCOPE_SUBTREE, "uid={}".format(entry_name), attr_list)
+    entries_list = []
+    for entries in (executor.map(_search, insts) if executor else map(_search, insts)):
         entries_list += entries
 
     return entries_list
 
+
+def wait_for_repl_entries(topo, entry_name, attr_list, predicate, timeout=10, interval=0.05,
+                          executor=None):
+    """Poll the test entries on all suppliers until predicate(entries) is true
+
+    The entries found by the last search are returned even if the timeout
+    expires, so the caller can assert on them and report the actual state.
+    """
+
+    deadline = time.monotonic() + timeout
+    while True:
+        entries = get_repl_entries(topo, entry_name, attr_list, executor)
+        if predicate(entries) or time.monotonic() >= deadline:
+            return entries
+        time.sleep(interval)
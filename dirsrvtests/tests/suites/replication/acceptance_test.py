@@ -9,23 +9,30 @@
 import pytest
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from ldap.controls.readentry import PostReadControl
 from lib389.replica import Replicas
 from lib389.tasks import *
 from lib389.utils import *
 from lib389.topologies import topology_m4 as topo_m4
 from lib389.topologies import topology_m2 as topo_m2
-from . import get_repl_entries
+from . import get_repl_entries, wait_for_repl_entries
 from lib389.idm.user import UserAccount
 from lib389.replica import ReplicationManager, Changelog
 from lib389._constants import *
 
-pytestmark = pytest.mark.tier0
+# Keep every test of this module on the same pytest-xdist worker
+# (with --dist=loadgroup) so the supplier topologies are only built once
+pytestmark = [pytest.mark.tier0,
+              pytest.mark.xdist_group(name="replication_acceptance")]
 
 TEST_ENTRY_NAME = 'mmrepl_test'
 TEST_ENTRY_DN = 'uid={},{}'.format(TEST_ENTRY_NAME, DEFAULT_SUFFIX)
 NEW_SUFFIX_NAME = 'test_repl'
 NEW_SUFFIX = 'o={}'.format(NEW_SUFFIX_NAME)
 NEW_BACKEND = 'repl_base'
+TEST_ENTRY_OCS = ('top', 'person', 'organizationalPerson', 'inetorgperson')
+NEW_SUFFIX_OCS = ('top', 'organization')
 
 DEBUGGING = os.getenv("DEBUGGING", default=False)
 if DEBUGGING:
@@ -35,17 +42,12 @@ else:
 log = logging.getLogger(__name__)
 
 
-@pytest.fixture(scope="function")
-def create_entry(topo_m4, request):
-    """Add test entry to supplier1"""
+def _add_test_entry(inst):
+    """Add the test entry to inst, replacing any leftover copy"""
 
     log.info('Adding entry {}'.format(TEST_ENTRY_DN))
 
-    test_user = UserAccount(topo_m4.ms["supplier1"], TEST_ENTRY_DN)
-    if test_user.exists():
-        log.info('Deleting entry {}'.format(TEST_ENTRY_DN))
-        test_user.delete()
-    test_user.create(properties={
+    properties = {
         'uid': TEST_ENTRY_NAME,
         'cn': TEST_ENTRY_NAME,
         'sn': TEST_ENTRY_NAME,
@@ -53,38 +55,71 @@ def create_entry(topo_m4, request):
         'uidNumber' : '1000',
         'gidNumber' : '2000',
         'homeDirectory' : '/home/mmrepl_test',
-    })
+    }
+    test_user = UserAccount(inst, TEST_ENTRY_DN)
+    # Many tests delete or rename the entry, so only pay for the
+    # delete when a previous test actually left it behind
+    try:
+        test_user.create(properties=properties)
+    except ldap.ALREADY_EXISTS:
+        log.info('Deleting entry {}'.format(TEST_ENTRY_DN))
+        test_user.delete()
+        test_user.create(properties=properties)
+    return test_user
+
 
 @pytest.fixture(scope="function")
-def new_suffix(topo_m4, request):
+def create_entry(topo_m4, request):
+    """Add test entry to supplier1"""
+
+    _add_test_entry(topo_m4.ms["supplier1"])
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """Thread pool shared by the fixtures and tests that fan out per-supplier work"""
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="function")
+def new_suffix(topo_m2, executor, request):
     """Add a new suffix and enable a replication on it"""
 
-    for num in range(1, 5):
-        log.info('Adding suffix:{} and backend: {} to supplier{}'.format(NEW_SUFFIX, NEW_BACKEND, num))
-        topo_m4.ms["supplier{}".format(num)].backend.create(NEW_SUFFIX, {BACKEND_NAME: NEW_BACKEND})
-        topo_m4.ms["supplier{}".format(num)].mappingtree.create(NEW_SUFFIX, NEW_BACKEND)
+    suppliers = list(topo_m2.ms.values())
+
+    # Each supplier has its own connection, so the per-supplier
+    # setup and teardown can run concurrently
+    def _setup_supplier(supplier):
+        log.info('Adding suffix:{} and backend: {} to {}'.format(NEW_SUFFIX, NEW_BACKEND, supplier.serverid))
+        supplier.backend.create(NEW_SUFFIX, {BACKEND_NAME: NEW_BACKEND})
+        supplier.mappingtree.create(NEW_SUFFIX, NEW_BACKEND)
 
         try:
-            topo_m4.ms["supplier{}".format(num)].add_s(Entry((NEW_SUFFIX, {
-                'objectclass': 'top',
-                'objectclass': 'organization',
+            supplier.add_s(Entry((NEW_SUFFIX, {
+                'objectclass': NEW_SUFFIX_OCS,
                 'o': NEW_SUFFIX_NAME,
                 'description': NEW_SUFFIX_NAME
             })))
         except ldap.LDAPError as e:
-            log.error('Failed to add suffix ({}): error ({})'.format(NEW_SUFFIX, e.message['desc']))
+            log.error('Failed to add suffix ({}): error ({})'.format(NEW_SUFFIX, e.args[0]['desc']))
             raise
 
+    def _teardown_supplier(supplier):
+        log.info('Deleting suffix:{} and backend: {} from {}'.format(NEW_SUFFIX, NEW_BACKEND, supplier.serverid))
+        supplier.mappingtree.delete(NEW_SUFFIX)
+        supplier.backend.delete(NEW_SUFFIX)
+
+    list(executor.map(_setup_supplier, suppliers))
+
     def fin():
-        for num in range(1, 5):
-            log.info('Deleting suffix:{} and backend: {} from supplier{}'.format(NEW_SUFFIX, NEW_BACKEND, num))
-            topo_m4.ms["supplier{}".format(num)].mappingtree.delete(NEW_SUFFIX)
-            topo_m4.ms["supplier{}".format(num)].backend.delete(NEW_SUFFIX)
+        list(executor.map(_teardown_supplier, suppliers))
 
     request.addfinalizer(fin)
 
 
-def test_add_entry(topo_m4, create_entry):
+def test_add_entry(topo_m4, create_entry, executor):
     """Check that entries are replicated after add operation
 
     :id: 024250f1-5f7e-4f3b-a9f5-27741e6fd405
@@ -95,81 +130,72 @@ def test_add_entry(topo_m4, create_entry):
         1. The entry should be replicated to all suppliers
     """
 
-    entries = get_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"])
-    assert all(entries), "Entry {} wasn't replicated successfully".format(TEST_ENTRY_DN)
+    entries = wait_for_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"],
+                                    lambda es: len(es) == len(topo_m4.all_insts),
+                                    executor=executor)
+    assert len(entries) == len(topo_m4.all_insts), "Entry {} wasn't replicated successfully".format(TEST_ENTRY_DN)
 
 
-def test_modify_entry(topo_m4, create_entry):
+@pytest.mark.parametrize("operation", ["add", "replace", "delete"])
+def test_modify_entry(topo_m4, create_entry, operation):
     """Check that entries are replicated after modify operation
 
     :id: 36764053-622c-43c2-a132-d7a3ab7d9aaa
+    :parametrized: yes
     :setup: Four suppliers replication setup, an entry
     :steps:
-        1. Modify the entry on supplier1 - add attribute
+        1. Modify the entry on supplier1 - add, replace or delete attribute,
+           reading the modified entry back with a post-read control
         2. Wait for replication to happen
         3. Check entry on all other suppliers
-        4. Modify the entry on supplier1 - replace attribute
-        5. Wait for replication to happen
-        6. Check entry on all other suppliers
-        7. Modify the entry on supplier1 - delete attribute
-        8. Wait for replication to happen
-        9. Check entry on all other suppliers
     :expectedresults:
-        1. Attribute should be successfully added
+        1. Attribute should be successfully added, replaced or deleted
+           and the returned entry should contain the change
         2. Some time should pass
         3. The change should be present on all suppliers
-        4. Attribute should be successfully replaced
-        5. Some time should pass
-        6. The change should be present on all suppliers
-        7. Attribute should be successfully deleted
-        8. Some time should pass
-        9. The change should be present on all suppliers
     """
-    if DEBUGGING:
-        sleep_time = 8
-    else:
-        sleep_time = 2
-
-    log.info('Modifying entry {} - add operation'.format(TEST_ENTRY_DN))
 
     m1 = topo_m4.ms["supplier1"]
     m2 = topo_m4.ms["supplier2"]
     m3 = topo_m4.ms["supplier3"]
     m4 = topo_m4.ms["supplier4"]
     repl = ReplicationManager(DEFAULT_SUFFIX)
+    old_mail = '{}@redhat.com'.format(TEST_ENTRY_NAME)
+    new_mail = '{}@greenhat.com'.format(TEST_ENTRY_NAME)
 
-    test_user = UserAccount(topo_m4.ms["supplier1"], TEST_ENTRY_DN)
-    test_user.add('mail', '{}@redhat.com'.format(TEST_ENTRY_NAME))
-    repl.wait_for_replication(m1, m2)
-    repl.wait_for_replication(m1, m3)
-    repl.wait_for_replication(m1, m4)
-
-    all_user = topo_m4.all_get_dsldapobject(TEST_ENTRY_DN, UserAccount)
-    for u in all_user:
-        assert "{}@redhat.com".format(TEST_ENTRY_NAME) in u.get_attr_vals_utf8('mail')
+    def _check_mails(mails):
+        if present is not None:
+            assert present in mails
+        if absent is not None:
+            assert absent not in mails
 
-    log.info('Modifying entry {} - replace operation'.format(TEST_ENTRY_DN))
-    test_user.replace('mail', '{}@greenhat.com'.format(TEST_ENTRY_NAME))
-    repl.wait_for_replication(m1, m2)
-    repl.wait_for_replication(m1, m3)
-    repl.wait_for_replication(m1, m4)
+    test_user = UserAccount(m1, TEST_ENTRY_DN)
+    if operation == "add":
+        mods = [(ldap.MOD_ADD, 'mail', [ensure_bytes(old_mail)])]
+        present, absent = old_mail, None
+    elif operation == "replace":
+        test_user.add('mail', old_mail)
+        mods = [(ldap.MOD_REPLACE, 'mail', [ensure_bytes(new_mail)])]
+        present, absent = new_mail, old_mail
+    else:
+        test_user.add('mail', new_mail)
+        mods = [(ldap.MOD_DELETE, 'mail', [ensure_bytes(new_mail)])]
+        present, absent = None, new_mail
 
-    all_user = topo_m4.all_get_dsldapobject(TEST_ENTRY_DN, UserAccount)
-    for u in all_user:
-        assert "{}@greenhat.com".format(TEST_ENTRY_NAME) in u.get_attr_vals_utf8('mail')
+    log.info('Modifying entry {} - {} operation'.format(TEST_ENTRY_DN, operation))
+    pr = PostReadControl(criticality=True, attrList=['mail'])
+    _, _, _, resp_ctrls = m1.modify_ext_s(TEST_ENTRY_DN, mods, serverctrls=[pr])
+    _check_mails(ensure_list_str(resp_ctrls[0].entry.get('mail', [])))
 
-    log.info('Modifying entry {} - delete operation'.format(TEST_ENTRY_DN))
-    test_user.remove('mail', '{}@greenhat.com'.format(TEST_ENTRY_NAME))
     repl.wait_for_replication(m1, m2)
     repl.wait_for_replication(m1, m3)
     repl.wait_for_replication(m1, m4)
 
-    all_user = topo_m4.all_get_dsldapobject(TEST_ENTRY_DN, UserAccount)
-    for u in all_user:
-        assert "{}@greenhat.com".format(TEST_ENTRY_NAME) not in u.get_attr_vals_utf8('mail')
+    for inst in (m2, m3, m4):
+        _check_mails(UserAccount(inst, TEST_ENTRY_DN).get_attr_vals_utf8('mail'))
 
 
-def test_delete_entry(topo_m4, create_entry):
+def test_delete_entry(topo_m4, create_entry, executor):
     """Check that entry deletion is replicated after delete operation
 
     :id: 18437262-9d6a-4b98-a47a-6182501ab9bc
@@ -182,18 +208,16 @@ def test_delete_entry(topo_m4, create_entry):
         2. The change should be present on all suppliers
     """
 
+    m1 = topo_m4.ms["supplier1"]
+
     log.info('Deleting entry {} during the test'.format(TEST_ENTRY_DN))
-    topo_m4.ms["supplier1"].delete_s(TEST_ENTRY_DN)
-    if DEBUGGING:
-        time.sleep(8)
-    else:
-        time.sleep(1)
-    entries = get_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"])
+    m1.delete_s(TEST_ENTRY_DN)
+    entries = wait_for_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"], lambda es: not es, executor=executor)
     assert not entries, "Entry deletion {} wasn't replicated successfully".format(TEST_ENTRY_DN)
 
 
 @pytest.mark.parametrize("delold", [0, 1])
-def test_modrdn_entry(topo_m4, create_entry, delold):
+def test_modrdn_entry(topo_m4, create_entry, delold, executor):
     """Check that entries are replicated after modrdn operation
 
     :id: 02558e6d-a745-45ae-8d88-34fe9b16adc9
@@ -207,32 +231,35 @@ def test_modrdn_entry(topo_m4, create_entry, delold):
         2. The change should be present on all suppliers
     """
 
+    m1 = topo_m4.ms["supplier1"]
     newrdn_name = 'newrdn'
     newrdn_dn = 'uid={},{}'.format(newrdn_name, DEFAULT_SUFFIX)
     log.info('Modify entry RDN {}'.format(TEST_ENTRY_DN))
     try:
-        topo_m4.ms["supplier1"].modrdn_s(TEST_ENTRY_DN, 'uid={}'.format(newrdn_name), delold)
+        m1.modrdn_s(TEST_ENTRY_DN, 'uid={}'.format(newrdn_name), delold)
     except ldap.LDAPError as e:
         log.error('Failed to modrdn entry (%s): error (%s)' % (TEST_ENTRY_DN,
-                                                               e.message['desc']))
+                                                               e.args[0]['desc']))
         raise e
 
+    num_insts = len(topo_m4.all_insts)
     try:
-        entries_new = get_repl_entries(topo_m4, newrdn_name, ["uid"])
-        assert all(entries_new), "Entry {} wasn't replicated successfully".format(newrdn_name)
+        entries_new = wait_for_repl_entries(topo_m4, newrdn_name, ["uid"], lambda es: len(es) == num_insts,
+                                            executor=executor)
+        assert len(entries_new) == num_insts, "Entry {} wasn't replicated successfully".format(newrdn_name)
         if delold == 0:
-            entries_old = get_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"])
-            assert all(entries_old), "Entry with old rdn {} wasn't replicated successfully".format(TEST_ENTRY_DN)
+            entries_old = get_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"], executor=executor)
+            assert len(entries_old) == num_insts, "Entry with old rdn {} wasn't replicated successfully".format(TEST_ENTRY_DN)
         else:
-            entries_old = get_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"])
+            entries_old = get_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"], executor=executor)
             assert not entries_old, "Entry with old rdn {} wasn't removed in replicas successfully".format(
                 TEST_ENTRY_DN)
     finally:
         log.info('Remove entry with new RDN {}'.format(newrdn_dn))
-        topo_m4.ms["supplier1"].delete_s(newrdn_dn)
+        m1.delete_s(newrdn_dn)
 
 
-def test_modrdn_after_pause(topo_m4):
+def test_modrdn_after_pause(topo_m4, executor):
     """Check that changes are properly replicated after replica pause
 
     :id: 6271dc9c-a993-4a9e-9c6d-05650cdab282
@@ -251,27 +278,21 @@ def test_modrdn_after_pause(topo_m4):
         5. The change should be present on all suppliers
     """
 
-    if DEBUGGING:
-        sleep_time = 8
-    else:
-        sleep_time = 3
-
+    m1 = topo_m4.ms["supplier1"]
     newrdn_name = 'newrdn'
     newrdn_dn = 'uid={},{}'.format(newrdn_name, DEFAULT_SUFFIX)
 
     log.info('Adding entry {}'.format(TEST_ENTRY_DN))
     try:
-        topo_m4.ms["supplier1"].add_s(Entry((TEST_ENTRY_DN, {
-            'objectclass': 'top person'.split(),
-            'objectclass': 'organizationalPerson',
-            'objectclass': 'inetorgperson',
+        m1.add_s(Entry((TEST_ENTRY_DN, {
+            'objectclass': TEST_ENTRY_OCS,
             'cn': TEST_ENTRY_NAME,
             'sn': TEST_ENTRY_NAME,
             'uid': TEST_ENTRY_NAME
         })))
     except ldap.LDAPError as e:
         log.error('Failed to add entry (%s): error (%s)' % (TEST_ENTRY_DN,
-                                                            e.message['desc']))
+                                                            e.args[0]['desc']))
         raise e
 
     log.info('Pause all replicas')
@@ -279,89 +300,36 @@ def test_modrdn_after_pause(topo_m4):
 
     log.info('Modify entry RDN {}'.format(TEST_ENTRY_DN))
     try:
-        topo_m4.ms["supplier1"].modrdn_s(TEST_ENTRY_DN, 'uid={}'.format(newrdn_name))
+        m1.modrdn_s(TEST_ENTRY_DN, 'uid={}'.format(newrdn_name))
     except ldap.LDAPError as e:
         log.error('Failed to modrdn entry (%s): error (%s)' % (TEST_ENTRY_DN,
-                                                               e.message['desc']))
+                                                               e.args[0]['desc']))
         raise e
 
     log.info('Resume all replicas')
     topo_m4.resume_all_replicas()
 
     log.info('Wait for replication to happen')
-    time.sleep(sleep_time)
+    repl = ReplicationManager(DEFAULT_SUFFIX)
+    for num in range(2, 5):
+        repl.wait_for_replication(m1, topo_m4.ms["supplier{}".format(num)])
 
     try:
-        entries_new = get_repl_entries(topo_m4, newrdn_name, ["uid"])
-        assert all(entries_new), "Entry {} wasn't replicated successfully".format(newrdn_name)
+        entries_new = get_repl_entries(topo_m4, newrdn_name, ["uid"], executor=executor)
+        assert len(entries_new) == len(topo_m4.all_insts), "Entry {} wasn't replicated successfully".format(newrdn_name)
     finally:
         log.info('Remove entry with new RDN {}'.format(newrdn_dn))
-        topo_m4.ms["supplier1"].delete_s(newrdn_dn)
-
-
-@pytest.mark.bz842441
-def test_modify_stripattrs(topo_m4):
-    """Check that we can modify nsds5replicastripattrs
-
-    :id: f36abed8-e262-4f35-98aa-71ae55611aaa
-    :setup: Four suppliers replication setup
-    :steps:
-        1. Modify nsds5replicastripattrs attribute on any agreement
-        2. Search for the modified attribute
-    :expectedresults: It should be contain the value
-        1. nsds5replicastripattrs should be successfully set
-        2. The modified attribute should be the one we set
-    """
-
-    m1 = topo_m4.ms["supplier1"]
-    agreement = m1.agreement.list(suffix=DEFAULT_SUFFIX)[0].dn
-    attr_value = b'modifiersname modifytimestamp'
-
-    log.info('Modify nsds5replicastripattrs with {}'.format(attr_value))
-    m1.modify_s(agreement, [(ldap.MOD_REPLACE, 'nsds5replicastripattrs', [attr_value])])
-
-    log.info('Check nsds5replicastripattrs for {}'.format(attr_value))
-    entries = m1.search_s(agreement, ldap.SCOPE_BASE, "objectclass=*", ['nsds5replicastripattrs'])
-    assert attr_value in entries[0].data['nsds5replicastripattrs']
-
-
-def test_new_suffix(topo_m4, new_suffix):
-    """Check that we can enable replication on a new suffix
-
-    :id: d44a9ed4-26b0-4189-b0d0-b2b336ddccbd
-    :setup: Four suppliers replication setup, a new suffix
-    :steps:
-        1. Enable replication on the new suffix
-        2. Check if replication works
-        3. Disable replication on the new suffix
-    :expectedresults:
-        1. Replication on the new suffix should be enabled
-        2. Replication should work
-        3. Replication on the new suffix should be disabled
-    """
-    m1 = topo_m4.ms["supplier1"]
-    m2 = topo_m4.ms["supplier2"]
-
-    repl = ReplicationManager(NEW_SUFFIX)
-
-    repl.create_first_supplier(m1)
-
-    repl.join_supplier(m1, m2)
-
-    repl.test_replication(m1, m2)
-    repl.test_replication(m2, m1)
+        m1.delete_s(newrdn_dn)
 
-    repl.remove_supplier(m1)
-    repl.remove_supplier(m2)
 
-def test_many_attrs(topo_m4, create_entry):
+def test_many_attrs(topo_m4, create_entry, executor):
     """Check a replication with many attributes (add and delete)
 
     :id: d540b358-f67a-43c6-8df5-7c74b3cb7523
     :setup: Four suppliers replication setup, a test entry
     :steps:
-        1. Add 10 new attributes to the entry
-        2. Delete few attributes: one from the beginning,
+        1. Add 10 new attribute values to the entry in a single modify
+        2. Delete few values in a single modify: one from the beginning,
            two from the middle and one from the end
         3. Check that the changes were replicated in the right order
     :expectedresults:
@@ -371,42 +339,39 @@ def test_many_attrs(topo_m4, create_entry):
     """
 
     m1 = topo_m4.ms["supplier1"]
-    add_list = ensure_list_bytes(map(lambda x: "test{}".format(x), range(10)))
-    delete_list = ensure_list_bytes(map(lambda x: "test{}".format(x), [0, 4, 7, 9]))
-    test_user = UserAccount(topo_m4.ms["supplier1"], TEST_ENTRY_DN)
+    add_list = ["test{}".format(x).encode() for x in range(10)]
+    delete_list = [add_list[x] for x in (0, 4, 7, 9)]
+    test_user = UserAccount(m1, TEST_ENTRY_DN)
 
-    log.info('Modifying entry {} - 10 add operations'.format(TEST_ENTRY_DN))
-    for add_name in add_list:
-        test_user.add('description', add_name)
-
-    if DEBUGGING:
-        time.sleep(10)
-    else:
-        time.sleep(1)
+    log.info('Modifying entry {} - add 10 values in one operation'.format(TEST_ENTRY_DN))
+    test_user.add('description', add_list)
 
     log.info('Check that everything was properly replicated after an add operation')
-    entries = get_repl_entries(topo_m4, TEST_ENTRY_NAME, ["description"])
+    num_insts = len(topo_m4.all_insts)
+    entries = wait_for_repl_entries(topo_m4, TEST_ENTRY_NAME, ["description"],
+                                    lambda es: len(es) == num_insts and
+                                    all(len(e.getValues("description")) == len(add_list) for e in es),
+                                    executor=executor)
+    assert len(entries) == num_insts, "Entry {} wasn't replicated successfully".format(TEST_ENTRY_DN)
     for entry in entries:
-        assert all(entry.getValues("description")[i] == add_name for i, add_name in enumerate(add_list))
+        assert entry.getValues("description") == add_list
 
-    log.info('Modifying entry {} - 4 delete operations for {}'.format(TEST_ENTRY_DN, str(delete_list)))
-    for delete_name in delete_list:
-        test_user.remove('description', delete_name)
-
-    if DEBUGGING:
-        time.sleep(10)
-    else:
-        time.sleep(1)
+    log.info('Modifying entry {} - delete {} in one operation'.format(TEST_ENTRY_DN, str(delete_list)))
+    test_user.remove('description', delete_list)
 
     log.info('Check that everything was properly replicated after a delete operation')
-    entries = get_repl_entries(topo_m4, TEST_ENTRY_NAME, ["description"])
+    delete_set = set(delete_list)
+    expected = [name for name in add_list if name not in delete_set]
+    entries = wait_for_repl_entries(topo_m4, TEST_ENTRY_NAME, ["description"],
+                                    lambda es: len(es) == num_insts and
+                                    all(len(e.getValues("description")) == len(expected) for e in es),
+                                    executor=executor)
+    assert len(entries) == num_insts, "Entry {} wasn't replicated successfully".format(TEST_ENTRY_DN)
     for entry in entries:
-        for i, value in enumerate(entry.getValues("description")):
-            assert value == [name for name in add_list if name not in delete_list][i]
-            assert value not in delete_list
+        assert entry.getValues("description") == expected
 
 
-def test_double_delete(topo_m4, create_entry):
+def test_double_delete(topo_m4, create_entry, executor):
     """Check that double delete of the entry doesn't crash server
 
     :id: 5b85a5af-df29-42c7-b6cb-965ec5aa478e
@@ -418,27 +383,21 @@ def test_double_delete(topo_m4, create_entry):
     :expectedresults: Server hasn't crash
     """
 
-    log.info('Deleting entry {} from supplier1'.format(TEST_ENTRY_DN))
-    topo_m4.ms["supplier1"].delete_s(TEST_ENTRY_DN)
+    m1 = topo_m4.ms["supplier1"]
+    m2 = topo_m4.ms["supplier2"]
 
-    if DEBUGGING:
-        time.sleep(5)
-    else:
-        time.sleep(1)
+    log.info('Deleting entry {} from supplier1'.format(TEST_ENTRY_DN))
+    m1.delete_s(TEST_ENTRY_DN)
+    ReplicationManager(DEFAULT_SUFFIX).wait_for_replication(m1, m2)
 
     log.info('Deleting entry {} from supplier2'.format(TEST_ENTRY_DN))
     try:
-        topo_m4.ms["supplier2"].delete_s(TEST_ENTRY_DN)
+        m2.delete_s(TEST_ENTRY_DN)
     except ldap.NO_SUCH_OBJECT:
         log.info("Entry {} wasn't found supplier2. It is expected.".format(TEST_ENTRY_DN))
 
-    if DEBUGGING:
-        time.sleep(5)
-    else:
-        time.sleep(1)
-        
     log.info('Make searches to check if server is alive')
-    entries = get_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"])
+    entries = wait_for_repl_entries(topo_m4, TEST_ENTRY_NAME, ["uid"], lambda es: not es, executor=executor)
     assert not entries, "Entry deletion {} wasn't replicated successfully".format(TEST_ENTRY_DN)
 
 
@@ -456,6 +415,8 @@ def test_password_repl_error(topo_m4, create_entry):
 
     m1 = topo_m4.ms["supplier1"]
     m2 = topo_m4.ms["supplier2"]
+    m3 = topo_m4.ms["supplier3"]
+    m4 = topo_m4.ms["supplier4"]
     TEST_ENTRY_NEW_PASS = 'new_{}'.format(TEST_ENTRY_NAME)
 
     log.info('Clean the error log')
@@ -465,16 +426,16 @@ def test_password_repl_error(topo_m4, create_entry):
     m2.config.loglevel((ErrorLog.REPLICA,))
 
     log.info('Modifying entry {} - change userpassword on supplier 2'.format(TEST_ENTRY_DN))
-    test_user_m1 = UserAccount(topo_m4.ms["supplier1"], TEST_ENTRY_DN)
-    test_user_m2 = UserAccount(topo_m4.ms["supplier2"], TEST_ENTRY_DN)
-    test_user_m3 = UserAccount(topo_m4.ms["supplier3"], TEST_ENTRY_DN)
-    test_user_m4 = UserAccount(topo_m4.ms["supplier4"], TEST_ENTRY_DN)
+    test_user_m1 = UserAccount(m1, TEST_ENTRY_DN)
+    test_user_m2 = UserAccount(m2, TEST_ENTRY_DN)
+    test_user_m3 = UserAccount(m3, TEST_ENTRY_DN)
+    test_user_m4 = UserAccount(m4, TEST_ENTRY_DN)
 
     test_user_m1.set('userpassword', TEST_ENTRY_NEW_PASS)
 
     log.info('Restart the servers to flush the logs')
-    for num in range(1, 5):
-        topo_m4.ms["supplier{}".format(num)].restart(timeout=10)
+    for inst in (m1, m2, m3, m4):
+        inst.restart(timeout=10)
 
     m1_conn = test_user_m1.bind(TEST_ENTRY_NEW_PASS)
     m2_conn = test_user_m2.bind(TEST_ENTRY_NEW_PASS)
@@ -513,18 +474,15 @@ def test_invalid_agmt(topo_m4):
     except ldap.UNWILLING_TO_PERFORM:
         m1.log.info('Invalid repl agreement correctly rejected')
     except ldap.LDAPError as e:
-        m1.log.fatal('Got unexpected error adding invalid agreement: ' + str(e))
-        assert False
+        pytest.fail('Got unexpected error adding invalid agreement: ' + str(e))
     else:
-        m1.log.fatal('Invalid agreement was incorrectly accepted by the server')
-        assert False
+        pytest.fail('Invalid agreement was incorrectly accepted by the server')
 
     # Verify the server is still running
     try:
         m1.simple_bind_s(DN_DM, PASSWORD)
     except ldap.LDAPError as e:
-        m1.log.fatal('Failed to bind: ' + str(e))
-        assert False
+        pytest.fail('Failed to bind: ' + str(e))
 
 
 def test_warining_for_invalid_replica(topo_m4):
@@ -539,7 +497,8 @@ def test_warining_for_invalid_replica(topo_m4):
         1. nsds5ReplicaBackoffMin should set to 20
         2. An error should be generated and also logged in the error logs.
     """
-    replicas = Replicas(topo_m4.ms["supplier1"])
+    m1 = topo_m4.ms["supplier1"]
+    replicas = Replicas(m1)
     replica = replicas.list()[0]
     log.info('Set nsds5ReplicaBackoffMin to 20')
     replica.set('nsds5ReplicaBackoffMin', '20')
@@ -549,7 +508,64 @@ def test_warining_for_invalid_replica(topo_m4):
     log.info('Resetting configuration: nsds5ReplicaBackoffMin')
     replica.remove_all('nsds5ReplicaBackoffMin')
     log.info('Check the error log for the error')
-    assert topo_m4.ms["supplier1"].ds_error_log.match('.*nsds5ReplicaBackoffMax.*10.*invalid.*')
+    assert m1.ds_error_log.match('.*nsds5ReplicaBackoffMax.*10.*invalid.*')
+
+
+@pytest.mark.bz842441
+def test_modify_stripattrs(topo_m2):
+    """Check that we can modify nsds5replicastripattrs
+
+    :id: f36abed8-e262-4f35-98aa-71ae55611aaa
+    :setup: Two suppliers replication setup
+    :steps:
+        1. Modify nsds5replicastripattrs attribute on any agreement
+        2. Search for the modified attribute
+    :expectedresults: It should be contain the value
+        1. nsds5replicastripattrs should be successfully set
+        2. The modified attribute should be the one we set
+    """
+
+    m1 = topo_m2.ms["supplier1"]
+    agreement = m1.agreement.list(suffix=DEFAULT_SUFFIX)[0].dn
+    attr_value = b'modifiersname modifytimestamp'
+
+    log.info('Modify nsds5replicastripattrs with {}'.format(attr_value))
+    m1.modify_s(agreement, [(ldap.MOD_REPLACE, 'nsds5replicastripattrs', [attr_value])])
+
+    log.info('Check nsds5replicastripattrs for {}'.format(attr_value))
+    entries = m1.search_s(agreement, ldap.SCOPE_BASE, "objectclass=*", ['nsds5replicastripattrs'])
+    assert attr_value in entries[0].data['nsds5replicastripattrs']
+
+
+def test_new_suffix(topo_m2, new_suffix):
+    """Check that we can enable replication on a new suffix
+
+    :id: d44a9ed4-26b0-4189-b0d0-b2b336ddccbd
+    :setup: Two suppliers replication setup, a new suffix
+    :steps:
+        1. Enable replication on the new suffix
+        2. Check if replication works
+        3. Disable replication on the new suffix
+    :expectedresults:
+        1. Replication on the new suffix should be enabled
+        2. Replication should work
+        3. Replication on the new suffix should be disabled
+    """
+    m1 = topo_m2.ms["supplier1"]
+    m2 = topo_m2.ms["supplier2"]
+
+    repl = ReplicationManager(NEW_SUFFIX)
+
+    repl.create_first_supplier(m1)
+
+    repl.join_supplier(m1, m2)
+
+    repl.test_replication(m1, m2)
+    repl.test_replication(m2, m1)
+
+    repl.remove_supplier(m1)
+    repl.remove_supplier(m2)
+
 
 @pytest.mark.ds51082
 def test_csnpurge_large_valueset(topo_m2):
@@ -655,13 +671,9 @@ def test_urp_trigger_substring_search(topo_m2):
     })
 
     # check that the ADD was replicated on M2
+    ReplicationManager(DEFAULT_SUFFIX).wait_for_replication(m1, m2)
     test_user_m2 = UserAccount(m2, test_asterisk_dn)
-    for i in range(1,5):
-        if test_user_m2.exists():
-            break
-        else:
-            log.info('Entry not yet replicated on M2, wait a bit')
-            time.sleep(3)
+    assert test_user_m2.exists()
 
     # check that M2 access logs does not "(&(objectclass=nstombstone)(nscpentrydn=uid=asterisk_*_in_value,dc=example,dc=com))"
     log.info('Check that on M2, URP as not triggered such internal search')
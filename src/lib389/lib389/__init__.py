@@ -332,7 +332,7 @@ class DirSrv(SimpleLDAPObject, object):
         from lib389.agreement import AgreementLegacy as Agreement
         from lib389.schema import SchemaLegacy as Schema
         from lib389.plugins import Plugins
-        from lib389.tasks import Tasks
+        from lib389.tasks import Tasks, TaskConnectionPool
         from lib389.index import IndexLegacy as Index
         from lib389.monitor import Monitor, MonitorLDBM
         from lib389.rootdse import RootDSE
@@ -350,6 +350,11 @@ class DirSrv(SimpleLDAPObject, object):
         self.schema = Schema(self)
         self.plugins = Plugins(self)
         self.tasks = Tasks(self)
+        # open() may be called again on this instance: do not leak the
+        # connections of the previous pool
+        if getattr(self, 'task_pool', None) is not None:
+            self.task_pool.close()
+        self.task_pool = TaskConnectionPool(self)
         self.saslmap = SaslMapping(self)
         self.pwpolicy = PwPolicyManager(self)
         # Do we have a certdb path?
@@ -1089,6 +1094,9 @@ class DirSrv(SimpleLDAPObject, object):
             @return None
             @raise ValueError - if the instance has not the right state
         '''
+        if hasattr(self, 'task_pool'):
+            self.task_pool.close()
+
         # check that DirSrv was in DIRSRV_STATE_ONLINE state
         if self.state == DIRSRV_STATE_ONLINE:
             # Don't raise an error. Just move the state and return
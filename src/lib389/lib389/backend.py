@@ -24,7 +24,7 @@ from lib389.cos import (CosTemplates, CosIndirectDefinitions,
                         CosPointerDefinitions, CosClassicDefinitions)
 
 from lib389.index import Index, Indexes, VLVSearches, VLVSearch
-from lib389.tasks import ImportTask, ExportTask, Tasks
+from lib389.tasks import ImportTask, ExportTask, Tasks, invalidate_backend_caches
 from lib389.encrypted_attributes import EncryptedAttr, EncryptedAttrs
 
 
@@ -205,6 +205,7 @@ class BackendLegacy(object):
 
         self.log.debug("Delete backend entry %s", be_ent.dn)
         self.conn.delete_s(be_ent.dn)
+        invalidate_backend_caches(self.conn)
 
         return
 
@@ -333,6 +334,7 @@ class BackendLegacy(object):
             self.log.error("Could not add backend entry: %r", dn)
             raise e
 
+        invalidate_backend_caches(self.conn)
         backend_entry = self.conn._test_entry(dn, ldap.SCOPE_BASE)
 
         return backend_entry
@@ -628,6 +630,7 @@ class Backend(DSLdapObject):
                 # This is a subsuffix, set the parent suffix
                 properties['nsslapd-parent-suffix'] = parent_suffix
             self._mts.create(properties=properties)
+        invalidate_backend_caches(self._instance)
 
         # We can't create the sample entries unless a mapping tree was installed.
         if sample_entries is not False and create_mapping_tree is True:
@@ -669,6 +672,7 @@ class Backend(DSLdapObject):
 
         # Now remove our children, this is all ldbm config
         self._instance.delete_branch_s(self._dn, ldap.SCOPE_SUBTREE)
+        invalidate_backend_caches(self._instance)
 
     def get_suffix(self):
         return self.get_attr_val_utf8_l('nsslapd-suffix')
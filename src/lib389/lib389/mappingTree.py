@@ -13,6 +13,7 @@ from lib389.properties import *
 from lib389.utils import suffixfilt, normalizeDN
 from lib389 import Entry
 from lib389.exceptions import NoSuchEntryError, InvalidArgumentError
+from lib389.tasks import invalidate_backend_caches
 
 
 from lib389._mapped_object import DSLdapObjects, DSLdapObject
@@ -154,6 +155,7 @@ class MappingTreeLegacy(object):
             self.conn.add_s(entry)
         except ldap.LDAPError as e:
             raise ldap.LDAPError("Error adding suffix entry " + dn, e)
+        invalidate_backend_caches(self.conn)
 
         ret = self.conn._test_entry(dn, ldap.SCOPE_BASE)
         return ret
@@ -233,6 +235,7 @@ class MappingTreeLegacy(object):
             for entry in ents:
                 self.log.warning("Warning: %s (%s)", entry.dn, ent.dn)
             self.conn.delete_s(ent.dn)
+            invalidate_backend_caches(self.conn)
 
     def getProperties(self, suffix=None, bename=None, name=None,
                       properties=None):
@@ -396,6 +399,17 @@ class MappingTree(DSLdapObject):
         self._create_objectclasses = ['top', 'extensibleObject', 'nsMappingTree']
         self._protected = False
 
+    def create(self, rdn=None, properties=None, basedn=None):
+        """Add the mapping tree entry, see DSLdapObject.create()"""
+        mt = super(MappingTree, self).create(rdn, properties, basedn)
+        invalidate_backend_caches(self._instance)
+        return mt
+
+    def delete(self, recursive=False):
+        """Delete the mapping tree entry, see DSLdapObject.delete()"""
+        super(MappingTree, self).delete(recursive)
+        invalidate_backend_caches(self._instance)
+
     def set_parent(self, parent):
         """
         Set the parent suffix to create a tree of backends. For example:
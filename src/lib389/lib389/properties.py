@@ -451,6 +451,7 @@ INDEX_PROPNAME_TO_ATTRNAME = {INDEX_TYPE: 'nsIndexType',
 ####################################
 
 TASK_WAIT = "wait"
+TASK_DEFER_ADD = "defer-add"
 TASK_TOMB_STRIP = "strip-csn"
 EXPORT_REPL_INFO = "repl-info"
 
@@ -6,9 +6,12 @@
 # See LICENSE for details.
 # --- END COPYRIGHT BLOCK ---
 
-
+import time
 from lib389._mapped_object import DSLdapObject
 
+# How long the supported controls are remembered, in seconds
+ROOTDSE_CACHE_TTL = 3600
+
 
 class RootDSE(DSLdapObject):
     """
@@ -18,6 +21,8 @@ class RootDSE(DSLdapObject):
         """@param conn - a DirSrv instance """
         super(RootDSE, self).__init__(instance=conn)
         self._dn = ""
+        self._ctrls = None
+        self._ctrls_expire = 0
 
     def supported_sasl(self):
         return self.get_attr_vals_utf8('supportedSASLMechanisms')
@@ -46,6 +51,14 @@ class RootDSE(DSLdapObject):
     def supports_exop_ldapssotoken_revoke(self):
         return self.present("supportedExtension", "2.16.840.1.113730.3.5.16")
 
+    def supports_psearch(self):
+        return "2.16.840.1.113730.3.4.3" in self.get_supported_ctrls()
+
     def get_supported_ctrls(self):
-        return self.get_attr_vals_utf8('supportedControl')
+        # Asked before every task wait, and only changes with the server
+        # configuration, so remember it for a while
+        if self._ctrls is None or time.monotonic() >= self._ctrls_expire:
+            self._ctrls = self.get_attr_vals_utf8('supportedControl')
+            self._ctrls_expire = time.monotonic() + ROOTDSE_CACHE_TTL
+        return self._ctrls
 
@@ -7,18 +7,155 @@
 # --- END COPYRIGHT BLOCK ---
 
 import time
+import asyncio
+import functools
+import itertools
+import logging
+import os
 import os.path
+import threading
 import ldap
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from lib389 import Entry
 from lib389._mapped_object import DSLdapObject
-from lib389.utils import ensure_str
+from lib389.utils import ensure_bytes, ensure_str
 from lib389.exceptions import Error
 from lib389._constants import *
 from lib389.properties import (
         TASK_WAIT, EXPORT_REPL_INFO, MT_PROPNAME_TO_ATTRNAME, MT_SUFFIX,
-        TASK_TOMB_STRIP
+        TASK_TOMB_STRIP, TASK_DEFER_ADD, SER_ROOT_DN, SER_ROOT_PW
         )
+from ldap.controls.psearch import PersistentSearchControl
+
+# How long Tasks remembers backend name/suffix lookups, in seconds
+_BACKEND_CACHE_TTL = 60
+_BACKEND_NEGATIVE_CACHE_TTL = 5
+# The longest pause (seconds) between two non-blocking result3() polls of
+# the *_async methods
+_ASYNC_POLL_CAP = 0.5
+# Errors after which a TaskConnectionPool connection is not reused: it lost
+# the server, or it may still get the reply to an abandoned operation
+_CONNECTION_ERRORS = (ldap.SERVER_DOWN, ldap.CONNECT_ERROR, ldap.TIMEOUT)
+
+
+# The simple maintenance tasks started by Tasks._run_task(): the container
+# of their entries, and how they are named in the logs.  The containers are
+# built once, here; they stay str as python-ldap only takes str DNs.
+_TASKS = {
+    'fixupLinkedAttrs': (f'cn=fixup linked attributes,{DN_TASKS}',
+                         'Fixup Linked Attributes'),
+    'schemaReload': (f'cn=schema reload task,{DN_TASKS}', 'Schema Reload'),
+    'fixupWinsyncMembers': (f'cn=memberuid task,{DN_TASKS}',
+                            "fixupWinsyncMembers 'memberuid'"),
+    'syntaxValidate': (f'cn=syntax validate,{DN_TASKS}', 'Syntax Validate'),
+    'usnTombstoneCleanup': (f'cn=USN tombstone cleanup task,{DN_TASKS}',
+                            'USN tombstone cleanup'),
+    'sysconfigReload': (f'cn=sysconfig reload,{DN_TASKS}', 'Sysconfig Reload'),
+    'cleanAllRUV': (f'cn=cleanallruv,{DN_TASKS}', 'cleanAllRUV'),
+    'abortCleanAllRUV': (f'cn=abort cleanallruv,{DN_TASKS}', 'Abort cleanAllRUV'),
+    'upgradeDB': (f'cn=upgradedb,{DN_TASKS}', 'Upgradedb'),
+}
+
+# The Tasks methods run_tasks() accepts: the synchronous ones, each of
+# which starts a single task
+_RUN_TASKS_METHODS = frozenset(_TASKS) | frozenset((
+    'importLDIF', 'exportLDIF', 'db2bak', 'bak2db', 'reindex',
+    'fixupMemberOf', 'fixupTombstones', 'automemberRebuild',
+    'automemberExport', 'automemberMap'))
+
+# What every task entry built by Tasks._task_modlist() starts with
+_TASK_OBJECTCLASSES = (b'top', b'extensibleObject')
+
+# lib389.DirSrv, looked up on first use: lib389 imports this module
+# before it defines DirSrv
+_DIRSRV_CLS = None
+
+
+def _dirsrv_class():
+    global _DIRSRV_CLS
+    if _DIRSRV_CLS is None:
+        from lib389 import DirSrv
+        _DIRSRV_CLS = DirSrv
+    return _DIRSRV_CLS
+
+
+# Task names are the time this module was loaded, the process id and a
+# counter: only their uniqueness matters, and reading the clock (and the
+# time zone) for every task costs more than it is worth.  The pid keeps
+# apart processes started in the same microsecond, or forked from one
+# another after the import.
+_TASK_DATE_PREFIX = f"{datetime.now():%m%d%Y_%H%M%S_%f}"
+_task_counter = itertools.count()
+
+
+def _task_date():
+    """Return a unique timestamp to use in naming new task entries."""
+
+    return f"{_TASK_DATE_PREFIX}_{os.getpid():x}_{next(_task_counter):x}"
+
+
+def invalidate_backend_caches(instance):
+    """Make the Tasks of 'instance' forget the backend names and suffixes
+    it looked up, after a backend or a mapping tree was added or deleted.
+    The connections of its task_pool share these lookups, so they forget
+    them too."""
+
+    tasks = getattr(instance, 'tasks', None)
+    if isinstance(tasks, Tasks):
+        tasks._invalidate_backend_caches()
+
+
+def _run_concurrently(coros):
+    """Run the coroutines concurrently on a private event loop, and return
+    their results in order.
+
+    If one of them fails, the others are cancelled and waited for before
+    its exception is raised.
+    """
+
+    async def gather():
+        futures = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return await asyncio.gather(*futures)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            await asyncio.gather(*futures, return_exceptions=True)
+            raise
+
+    # The loop gets its own executor, so that its worker threads can be
+    # waited for before the loop is closed
+    executor = ThreadPoolExecutor()
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(executor)
+    try:
+        return loop.run_until_complete(gather())
+    finally:
+        executor.shutdown(wait=True)
+        loop.close()
+
+
+def _remaining(deadline):
+    """Return the seconds left until a time.monotonic() deadline.
+
+    -1 means there is no deadline, which is also what python-ldap expects
+    as an infinite result() timeout.
+    """
+
+    if deadline is None:
+        return -1
+    return max(deadline - time.monotonic(), 0)
+
+
+def _backoff_intervals(initial=0.05, factor=2, cap=2.0):
+    """Yield exponentially growing sleep intervals, capped at cap seconds."""
+
+    interval = initial
+    while True:
+        yield interval
+        interval = min(interval * factor, cap)
 
 
 class Task(DSLdapObject):
@@ -37,26 +174,55 @@ class Task(DSLdapObject):
         self._create_objectclasses = ['top', 'extensibleObject']
         self._protected = False
         self._exit_code = None
-        self._task_log = ""
         self._task_warn = None
+        self._current_item = None
 
     def status(self):
         """Return the decoded status of the task
         """
         return self.get_attr_val_utf8('nsTaskStatus')
 
+    def _set_status(self, entry):
+        """Remember the codes read from the task Entry 'entry'"""
+
+        exit_code = entry.getValue('nsTaskExitCode')
+        warn = entry.getValue('nsTaskWarning')
+        self._current_item = entry.getValue('nsTaskCurrentItem')
+        self._exit_code = ensure_str(exit_code) if exit_code is not None else None
+        self._task_warn = ensure_str(warn) if warn is not None else None
+
+    def _read_status(self):
+        """Read the exit and warning codes and the progress of the task in one search.
+
+        nsTaskLog is left out: it grows with the task, and would be
+        transferred again on every poll.  Return False if the task entry
+        is gone.
+        """
+
+        try:
+            ents = self._instance.search_ext_s(self._dn, ldap.SCOPE_BASE, '(objectclass=*)',
+                                               attrlist=['nsTaskExitCode', 'nsTaskWarning',
+                                                         'nsTaskCurrentItem'],
+                                               escapehatch='i am sure')
+        except ldap.NO_SUCH_OBJECT:
+            return False
+        self._set_status(ents[0])
+        return True
+
     def is_complete(self):
         """Return True if task is complete, else False."""
 
-        self._exit_code = self.get_attr_val_utf8("nsTaskExitCode")
-        self._task_log = self.get_attr_val_utf8("nsTaskLog")
-        self._task_warn = self.get_attr_val_utf8("nsTaskWarning")
-        if not self.exists():
+        # The exit code is written once, when the task ends
+        if self._exit_code is not None:
+            return True
+        if not self._read_status():
             self._log.debug("complete: task has self cleaned ...")
             # The task cleaned it self up.
             return True
         elif self._exit_code is not None:
-            self._log.debug("complete status: %s -> %s" % (self._exit_code, self.status()))
+            # status() is another read of the entry, only do it for the log
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug("complete status: %s -> %s", self._exit_code, self.status())
             return True
         return False
 
@@ -71,11 +237,11 @@ class Task(DSLdapObject):
         return None
 
     def get_task_log(self):
-        """Return task's exit code if task is complete, else None."""
+        """Return task's log if task is complete, else None."""
         if self.is_complete():
             try:
-                return (self._task_log)
-            except TypeError:
+                return self.get_attr_val_utf8('nsTaskLog')
+            except ldap.NO_SUCH_OBJECT:
                 return None
         return None
 
@@ -89,18 +255,86 @@ class Task(DSLdapObject):
         return None
 
     def wait(self, timeout=120):
-        """Wait until task is complete."""
+        """Wait until task is complete.
+
+        When the server supports it, a persistent search on the task entry
+        wakes us up as soon as the server updates it. Otherwise, or if the
+        server refuses the control, we poll with an exponential backoff.
+        """
 
-        time_passed = 0
-        sleep_interval = 2
         if timeout is None:
             self._log.debug("No timeout is set, this may take a long time ...")
+            deadline = None
+        else:
+            deadline = time.monotonic() + timeout
+
+        if self._instance.rootdse.supports_psearch():
+            try:
+                if self._wait_psearch(deadline):
+                    return
+            except (ldap.UNAVAILABLE_CRITICAL_EXTENSION, ldap.UNWILLING_TO_PERFORM,
+                    ldap.PROTOCOL_ERROR) as e:
+                self._log.debug("Persistent search is not available (%s), polling the task", e)
+        self._wait_poll(deadline)
+
+    def _wait_psearch(self, deadline):
+        """Wait for the task using a persistent search on its entry.
+
+        Return True once the task is complete or the deadline has passed,
+        False if the server ended the search and we need to poll instead.
+        """
 
-        while timeout is None or time_passed < timeout:
+        psc = PersistentSearchControl(criticality=True, changeTypes=['modify', 'delete'],
+                                      changesOnly=True, returnECs=False)
+        msgid = self._instance.search_ext(self._dn, ldap.SCOPE_BASE, '(objectclass=*)',
+                                          ['nsTaskExitCode', 'nsTaskWarning'],
+                                          serverctrls=[psc])
+        try:
+            # The task may have finished before the search was registered
             if self.is_complete():
-                break
-            time_passed = time_passed + sleep_interval
-            time.sleep(sleep_interval)
+                return True
+            # From now on, the codes come with the notifications: a busy
+            # task updates its entry all the time, and reading it again
+            # for each of them would cost more than polling
+            while self._exit_code is None:
+                remaining = _remaining(deadline)
+                if remaining == 0:
+                    return True
+                try:
+                    rtype, rdata, _, _ = self._instance.result4(msgid, all=0, timeout=remaining)
+                except ldap.TIMEOUT:
+                    return True
+                except ldap.NO_SUCH_OBJECT:
+                    # The task entry was already removed
+                    return True
+                if rtype == ldap.RES_SEARCH_RESULT:
+                    return False
+                for dn, attrs in rdata or []:
+                    if dn is not None:
+                        self._set_status(Entry((dn, attrs)))
+            return True
+        finally:
+            self._instance.abandon(msgid)
+
+    def _wait_poll(self, deadline):
+        """Poll the task entry with an exponential backoff until it is complete.
+
+        The backoff starts again from its shortest interval whenever
+        nsTaskCurrentItem moves, so a task that is making progress is
+        followed closely while a stalled one is polled less and less.
+        """
+
+        intervals = _backoff_intervals(0.05, 1.5, 5.0)
+        last_item = None
+        while not self.is_complete():
+            remaining = _remaining(deadline)
+            if remaining == 0:
+                return
+            if self._current_item != last_item:
+                last_item = self._current_item
+                intervals = _backoff_intervals(0.05, 1.5, 5.0)
+            interval = next(intervals)
+            time.sleep(interval if remaining < 0 else min(interval, remaining))
 
     def create(self, rdn=None, properties={}, basedn=None):
         """Create a Task entry
@@ -122,7 +356,7 @@ class Task(DSLdapObject):
     def _get_task_date():
         """Return a timestamp to use in naming new task entries."""
 
-        return datetime.now().isoformat()
+        return _task_date()
 
 
 class AutomemberRebuildMembershipTask(Task):
@@ -133,8 +367,8 @@ class AutomemberRebuildMembershipTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'automember_rebuild_' + Task._get_task_date()
-        dn = "cn=" + self.cn + "," + DN_AUTOMEMBER_REBUILD_TASK
+        self.cn = f'automember_rebuild_{Task._get_task_date()}'
+        dn = f"cn={self.cn},{DN_AUTOMEMBER_REBUILD_TASK}"
 
         super(AutomemberRebuildMembershipTask, self).__init__(instance, dn)
         self._must_attributes.extend(['basedn', 'filter'])
@@ -148,8 +382,8 @@ class AutomemberAbortRebuildTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'automember_abort_' + Task._get_task_date()
-        dn = "cn=" + self.cn + "," + DN_AUTOMEMBER_ABORT_REBUILD_TASK
+        self.cn = f'automember_abort_{Task._get_task_date()}'
+        dn = f"cn={self.cn},{DN_AUTOMEMBER_ABORT_REBUILD_TASK}"
 
         super(AutomemberAbortRebuildTask, self).__init__(instance, dn)
 
@@ -162,8 +396,8 @@ class FixupLinkedAttributesTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'fixup_linked_attrs_' + Task._get_task_date()
-        dn = "cn=" + self.cn + "," + DN_FIXUP_LINKED_ATTIBUTES
+        self.cn = f'fixup_linked_attrs_{Task._get_task_date()}'
+        dn = f"cn={self.cn},{DN_FIXUP_LINKED_ATTIBUTES}"
 
         super(FixupLinkedAttributesTask, self).__init__(instance, dn)
 
@@ -176,7 +410,7 @@ class MemberUidFixupTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'memberUid_fixup_' + Task._get_task_date()
+        self.cn = f'memberUid_fixup_{Task._get_task_date()}'
         dn = f"cn={self.cn},cn=memberuid task,cn=tasks,cn=config"
 
         super(MemberUidFixupTask, self).__init__(instance, dn)
@@ -191,8 +425,8 @@ class MemberOfFixupTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'memberOf_fixup_' + Task._get_task_date()
-        dn = "cn=" + self.cn + "," + DN_MBO_TASK
+        self.cn = f'memberOf_fixup_{Task._get_task_date()}'
+        dn = f"cn={self.cn},{DN_MBO_TASK}"
 
         super(MemberOfFixupTask, self).__init__(instance, dn)
         self._must_attributes.extend(['basedn'])
@@ -206,8 +440,8 @@ class USNTombstoneCleanupTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'usn_cleanup_' + Task._get_task_date()
-        dn = "cn=" + self.cn + ",cn=USN tombstone cleanup task," + DN_TASKS
+        self.cn = f'usn_cleanup_{Task._get_task_date()}'
+        dn = f"cn={self.cn},cn=USN tombstone cleanup task,{DN_TASKS}"
 
         super(USNTombstoneCleanupTask, self).__init__(instance, dn)
 
@@ -226,8 +460,8 @@ class csngenTestTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'csngenTest_' + Task._get_task_date()
-        dn = "cn=" + self.cn + ",cn=csngen_test," + DN_TASKS
+        self.cn = f'csngenTest_{Task._get_task_date()}'
+        dn = f"cn={self.cn},cn=csngen_test,{DN_TASKS}"
         super(csngenTestTask, self).__init__(instance, dn)
 
 
@@ -239,8 +473,8 @@ class EntryUUIDFixupTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'entryuuid_fixup_' + Task._get_task_date()
-        dn = "cn=" + self.cn + "," + DN_EUUID_TASK
+        self.cn = f'entryuuid_fixup_{Task._get_task_date()}'
+        dn = f"cn={self.cn},{DN_EUUID_TASK}"
         super(EntryUUIDFixupTask, self).__init__(instance, dn)
         self._must_attributes.extend(['basedn'])
 
@@ -253,8 +487,8 @@ class DBCompactTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'compact_db_' + Task._get_task_date()
-        dn = "cn=" + self.cn + "," + DN_COMPACTDB_TASK
+        self.cn = f'compact_db_{Task._get_task_date()}'
+        dn = f"cn={self.cn},{DN_COMPACTDB_TASK}"
         super(DBCompactTask, self).__init__(instance, dn)
 
 
@@ -266,8 +500,8 @@ class SchemaReloadTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'schema_reload_' + Task._get_task_date()
-        dn = "cn=" + self.cn + ",cn=schema reload task," + DN_TASKS
+        self.cn = f'schema_reload_{Task._get_task_date()}'
+        dn = f"cn={self.cn},cn=schema reload task,{DN_TASKS}"
         super(SchemaReloadTask, self).__init__(instance, dn)
 
 
@@ -279,7 +513,7 @@ class SyntaxValidateTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'syntax_validate_' + Task._get_task_date()
+        self.cn = f'syntax_validate_{Task._get_task_date()}'
         dn = f"cn={self.cn},cn=syntax validate,cn=tasks,cn=config"
 
         super(SyntaxValidateTask, self).__init__(instance, dn)
@@ -296,8 +530,8 @@ class AbortCleanAllRUVTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'abortcleanallruv_' + Task._get_task_date()
-        dn = "cn=" + self.cn + ",cn=abort cleanallruv," + DN_TASKS
+        self.cn = f'abortcleanallruv_{Task._get_task_date()}'
+        dn = f"cn={self.cn},cn=abort cleanallruv,{DN_TASKS}"
 
         super(AbortCleanAllRUVTask, self).__init__(instance, dn)
 
@@ -313,8 +547,8 @@ class CleanAllRUVTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'cleanallruv_' + Task._get_task_date()
-        dn = "cn=" + self.cn + ",cn=cleanallruv," + DN_TASKS
+        self.cn = f'cleanallruv_{Task._get_task_date()}'
+        dn = f"cn={self.cn},cn=cleanallruv,{DN_TASKS}"
         self._properties = None
 
         super(CleanAllRUVTask, self).__init__(instance, dn)
@@ -360,8 +594,8 @@ class ImportTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'import_' + Task._get_task_date()
-        dn = "cn=%s,%s" % (self.cn, DN_IMPORT_TASK)
+        self.cn = f'import_{Task._get_task_date()}'
+        dn = f"cn={self.cn},{DN_IMPORT_TASK}"
         self._properties = None
 
         super(ImportTask, self).__init__(instance, dn)
@@ -389,8 +623,8 @@ class ExportTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'export_' + Task._get_task_date()
-        dn = "cn=%s,%s" % (self.cn, DN_EXPORT_TASK)
+        self.cn = f'export_{Task._get_task_date()}'
+        dn = f"cn={self.cn},{DN_EXPORT_TASK}"
         self._properties = None
 
         super(ExportTask, self).__init__(instance, dn)
@@ -412,8 +646,8 @@ class BackupTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'backup_' + Task._get_task_date()
-        dn = "cn=" + self.cn + ",cn=backup," + DN_TASKS
+        self.cn = f'backup_{Task._get_task_date()}'
+        dn = f"cn={self.cn},cn=backup,{DN_TASKS}"
         self._properties = None
 
         super(BackupTask, self).__init__(instance, dn)
@@ -427,53 +661,355 @@ class RestoreTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'restore_' + Task._get_task_date()
-        dn = "cn=" + self.cn + ",cn=restore," + DN_TASKS
+        self.cn = f'restore_{Task._get_task_date()}'
+        dn = f"cn={self.cn},cn=restore,{DN_TASKS}"
         self._properties = None
 
         super(RestoreTask, self).__init__(instance, dn)
 
 
+class TaskConnectionPool(object):
+    """A few extra connections to an instance, so that tasks can be started
+    and waited for concurrently instead of one after the other on the
+    instance connection.
+
+    Connections are cloned from the instance, bound with its bind DN, and
+    opened on demand up to 'size', which defaults to the DS_TASK_POOL_SIZE
+    environment variable, or 4.  A size of 0 disables the pool: acquire()
+    then hands out the instance itself.
+
+    :param instance: An instance
+    :type instance: lib389.DirSrv
+    :param size: The maximum number of connections
+    :type size: int
+    """
+
+    def __init__(self, instance, size=None):
+        if size is None:
+            size = int(os.environ.get('DS_TASK_POOL_SIZE', 4))
+        self._instance = instance
+        self._size = size
+        self._idle = []
+        self._opened = 0
+        self._cond = threading.Condition()
+
+    @property
+    def size(self):
+        """The maximum number of connections, 0 if the pool is disabled"""
+        return self._size
+
+    def _open(self):
+        conn = self._instance.clone({SER_ROOT_DN: self._instance.binddn,
+                                     SER_ROOT_PW: self._instance.bindpw})
+        conn.open()
+        # Share the backend lookups of the instance, so that one
+        # invalidate_backend_caches() reaches every pooled connection
+        conn.tasks._mt_cache = self._instance.tasks._mt_cache
+        conn.tasks._be_cache = self._instance.tasks._be_cache
+        return conn
+
+    def _get(self):
+        with self._cond:
+            while not self._idle and self._opened >= self._size:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._opened += 1
+        conn = None
+        try:
+            conn = self._open()
+            return conn
+        finally:
+            if conn is None:
+                self._discard(None)
+
+    def _discard(self, conn):
+        try:
+            if conn is not None:
+                conn.close()
+        finally:
+            with self._cond:
+                self._opened -= 1
+                self._cond.notify()
+
+    def _release(self, conn):
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection, waiting for one to be free if they are all
+        in use. The connection is given back whatever the block raises,
+        unless it is a connection level error (see _CONNECTION_ERRORS):
+        such a connection is closed, and a new one is opened when needed.
+        """
+        if self._size <= 0:
+            yield self._instance
+            return
+        conn = self._get()
+        try:
+            yield conn
+        except _CONNECTION_ERRORS:
+            self._discard(conn)
+            conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._release(conn)
+
+    def close(self):
+        """Close the idle connections of the pool"""
+        with self._cond:
+            idle = self._idle
+            self._idle = []
+        for conn in idle:
+            self._discard(conn)
+
+
 class Tasks(object):
-    proxied_methods = 'search_s getEntry'.split()
+    proxied_methods = frozenset({'search_s', 'getEntry'})
 
     def __init__(self, conn):
         """@param conn - a DirSrv instance"""
         self.conn = conn
         self.log = conn.log
         self.dn = None  # DN of the last task attempted
-        self.entry = None
+        self._entry = None
+        # (dn, modlist) of the last task added by _run_task(), turned into
+        # self.entry only if someone asks for it
+        self._entry_data = None
+        self.task = None  # Task handle of the last task added
+        # bename -> suffix and suffix -> bename, as (value, expires_at)
+        self._mt_cache = {}
+        self._be_cache = {}
+        # Task entries waiting to be submitted by batch(), or None
+        self._pending = None
+        # (msgid, label, dn) of the task adds sent with 'defer-add'
+        self._unacked = []
+        # Task names issued by this object, see _new_task_cn().  The lock
+        # is for the *_async methods, which build names in executor threads
+        self._issued_cns = set()
+        self._issued_cns_lock = threading.Lock()
+
+    @property
+    def entry(self):
+        """Entry of the last task attempted"""
+        if self._entry is None and self._entry_data is not None:
+            dn, modlist = self._entry_data
+            self._entry = Entry((dn, dict(modlist)))
+        return self._entry
+
+    @entry.setter
+    def entry(self, entry):
+        self._entry = entry
+        self._entry_data = None
 
     def __getattr__(self, name):
-        from lib389 import DirSrv
         if name in Tasks.proxied_methods:
-            return DirSrv.__getattr__(self.conn, name)
+            return _dirsrv_class().__getattr__(self.conn, name)
+
+    def _cached(self, cache, key, lookup):
+        """Return lookup(key), remembering the answer for a while.
+
+        Failed lookups (ValueError) are remembered for a shorter time, so a
+        bad backend name does not hit the server on every call either.
+        """
+
+        now = time.monotonic()
+        hit = cache.get(key.lower())
+        if hit is not None and hit[1] > now:
+            value = hit[0]
+            if isinstance(value, ValueError):
+                raise ValueError(*value.args)
+            return value
+        try:
+            value = lookup(key)
+        except ValueError as e:
+            cache[key.lower()] = (e, now + _BACKEND_NEGATIVE_CACHE_TTL)
+            raise
+        cache[key.lower()] = (value, now + _BACKEND_CACHE_TTL)
+        return value
+
+    def _invalidate_backend_caches(self):
+        """Forget every cached backend lookup"""
+        self._mt_cache.clear()
+        self._be_cache.clear()
+
+    def _lookup_suffix(self, bename):
+        ents = self.conn.mappingtree.list(bename=bename)
+        if len(ents) != 1:
+            raise ValueError("invalid backend name: %s" % bename)
+
+        attr_suffix = MT_PROPNAME_TO_ATTRNAME[MT_SUFFIX]
+        if not ents[0].hasAttr(attr_suffix):
+            raise ValueError(
+                "invalid backend name: %s, or entry without %s" %
+                (bename, attr_suffix))
+
+        return ensure_str(ents[0].getValue(attr_suffix))
+
+    def _resolve_suffix(self, bename):
+        """Return the suffix of the backend 'bename'
+
+        @raise ValueError: if the backend does not exist
+        """
+        return self._cached(self._mt_cache, bename, self._lookup_suffix)
+
+    def _lookup_backend(self, suffix):
+        backend = None
+        for be in self.conn.backends.list():
+            be_suffix = ensure_str(be.get_attr_val_utf8_l('nsslapd-suffix')).lower()
+            if be_suffix == suffix.lower():
+                backend = be.get_attr_val_utf8_l('cn')
+        if backend is None:
+            raise ValueError("Failed to find backaned matching the suffix")
+        return backend
 
-    def checkTask(self, entry, dowait=False):
+    def _resolve_backend(self, suffix):
+        """Return the name of the backend holding 'suffix'
+
+        @raise ValueError: if no backend holds the suffix
+        """
+        return self._cached(self._be_cache, suffix, self._lookup_backend)
+
+    def _submit(self, entry):
+        """Add the task entry, or queue it when called inside batch().
+
+        @return True if the entry was queued, False if it was added
+        """
+        if self._pending is not None:
+            self._pending.append(entry)
+            return True
+        self.conn.add_s(entry)
+        return False
+
+    def submit_many(self, entries, timeout=-1):
+        """Add several task entries, sending all the requests before reading
+        any reply, so the whole lot costs about one round trip.
+
+        @param entries - list of task Entry objects
+        @param timeout - how long to wait for each reply, -1 is forever
+
+        @return a list with, for each entry, None if it was added or the
+                LDAPError the server answered with
+        """
+        msgids = [self.conn.add_ext(entry) for entry in entries]
+        errors = []
+        for msgid in msgids:
+            try:
+                self.conn.result3(msgid, all=1, timeout=timeout)
+                errors.append(None)
+            except ldap.LDAPError as e:
+                errors.append(e)
+        return errors
+
+    @contextmanager
+    def batch(self):
+        """Queue the tasks started by importLDIF, exportLDIF, reindex,
+        fixupMemberOf and fixupTombstones inside the block, and submit them
+        together with submit_many() when the block ends.
+
+        Queued tasks are not waited for, whatever their args say.  The
+        context value is the list of queued entries, so the caller can
+        checkTask() them once the block is over.
+
+        @raise LDAPError: the first error the server answered with, once
+                          every entry was submitted
+        """
+        if self._pending is not None:
+            raise ValueError("Task batches can not be nested")
+        pending = self._pending = []
+        try:
+            yield pending
+        finally:
+            self._pending = None
+
+        errors = self.submit_many(pending)
+        for entry, error in zip(pending, errors):
+            if isinstance(error, ldap.ALREADY_EXISTS):
+                self.log.error("Fail to add the task (%s)", entry.dn)
+            elif error is not None:
+                raise error
+
+    def _wait_task(self, dn, args):
+        """Keep a Task handle on the task just added in self.task, and wait
+        for it to complete if args ask for it.
+
+        @return (exitCode, warningCode), both 0 if we did not wait
+        """
+        self.task = Task(self.conn, dn)
+        if not (args and args.get(TASK_WAIT, False)):
+            return (0, 0)
+        self.task.wait(timeout=None)
+        return (self.task.get_exit_code() or 0, self.task.get_task_warn() or 0)
+
+    def checkTask(self, entry, dowait=False, timeout=None,
+                  initial=0.05, factor=1.5, cap=5.0):
         '''check task status - task is complete when the nsTaskExitCode attr
-        is set return a 2 tuple (true/false,code) first is false if task is
-        running, true if done - if true, second is the exit code - if dowait
-        is True, this function will block until the task is complete'''
-        attrlist = ['nsTaskLog', 'nsTaskStatus', 'nsTaskExitCode',
-                    'nsTaskCurrentItem', 'nsTaskTotalItems', 'nsTaskWarning']
-        done = False
-        exitCode = 0
-        warningCode = 0
+        is set return a 3 tuple (true/false,code,warning) first is false if
+        task is running, true if done - if true, second is the exit code - if
+        dowait is True, this function will block until the task is complete
+        or 'timeout' seconds have passed (None waits forever)
+
+        While waiting, the delay between two reads starts at 'initial'
+        seconds and grows by 'factor' up to 'cap'. It goes back to
+        'initial' whenever the task reports progress (nsTaskCurrentItem),
+        so a busy task is followed closely and an idle one is left alone.'''
+        # Only what is read below: nsTaskLog in particular grows with the
+        # task, and would be transferred again on every poll
+        attrlist = ['nsTaskExitCode', 'nsTaskWarning', 'nsTaskCurrentItem']
+        deadline = None if timeout is None else time.monotonic() + timeout
+        intervals = _backoff_intervals(initial, factor, cap)
+        current_item = None
         dn = entry.dn
-        while not done:
+        while True:
             entry = self.conn.getEntry(dn, attrlist=attrlist)
-            self.log.debug("task entry %r", entry)
+            # Entry.__repr__ renders the whole entry as LDIF, skip it when
+            # nobody is listening
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("task entry %r", entry)
 
-            if entry.nsTaskWarning:
-                warningCode = int(entry.nsTaskWarning)
+            warningCode = int(entry.nsTaskWarning) if entry.nsTaskWarning else 0
             if entry.nsTaskExitCode:
-                exitCode = int(entry.nsTaskExitCode)
-                done = True
-            if dowait:
-                time.sleep(1)
-            else:
-                break
-        return (done, exitCode, warningCode)
+                return (True, int(entry.nsTaskExitCode), warningCode)
+            remaining = _remaining(deadline)
+            if not dowait or remaining == 0:
+                return (False, 0, warningCode)
+            if entry.nsTaskCurrentItem != current_item:
+                current_item = entry.nsTaskCurrentItem
+                intervals = _backoff_intervals(initial, factor, cap)
+            interval = next(intervals)
+            time.sleep(interval if remaining < 0 else min(interval, remaining))
+
+    def checkTaskPersistent(self, entry, timeout=None):
+        '''wait for a task like checkTask(entry, True) does, but let the
+        server notify us of the task completion with a persistent search
+        instead of polling the task entry.  Servers that do not support
+        persistent searches are polled.
+
+        @return the same 3 tuple as checkTask'''
+        task = Task(self.conn, entry.dn)
+        task.wait(timeout)
+        if not task.is_complete():
+            return (False, 0, 0)
+        return (True, task.get_exit_code() or 0, task.get_task_warn() or 0)
+
+    def get_progress(self, entry):
+        '''return the progress of a task as a dict with the 'status', 'log',
+        'current' and 'total' items of its entry (None for the missing
+        ones)'''
+        attrs = {'status': 'nsTaskStatus', 'log': 'nsTaskLog',
+                 'current': 'nsTaskCurrentItem', 'total': 'nsTaskTotalItems'}
+        entry = self.conn.getEntry(entry.dn, attrlist=list(attrs.values()))
+        progress = {}
+        for key, attr in attrs.items():
+            value = entry.getValue(attr)
+            progress[key] = ensure_str(value) if value is not None else None
+        for key in ('current', 'total'):
+            if progress[key] is not None:
+                progress[key] = int(progress[key])
+        return progress
 
     def importLDIF(self, suffix=None, benamebase=None, input_file=None,
                    args=None):
@@ -514,24 +1050,27 @@ class Tasks(object):
             raise ValueError("Import file (%s) does not exist" % input_file)
 
         # Prepare the task entry
-        cn = "import_" + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = "cn=%s,%s" % (cn, DN_IMPORT_TASK)
+        cn = f"import_{_task_date()}"
+        dn = f"cn={cn},{DN_IMPORT_TASK}"
         entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('nsFilename', input_file)
+        attrs = {
+            'objectclass': ['top', 'extensibleObject'],
+            'cn': cn,
+            'nsFilename': input_file
+        }
         if benamebase:
-            entry.setValues('nsInstance', benamebase)
+            attrs['nsInstance'] = benamebase
         else:
-            entry.setValues('nsIncludeSuffix', suffix)
+            attrs['nsIncludeSuffix'] = suffix
+        entry.update(attrs)
 
         # start the task and possibly wait for task completion
-        self.conn.add_s(entry)
+        if self._submit(entry):
+            self.dn = dn
+            self.entry = entry
+            return 0
 
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error("Error: import task %s for file %s exited with %d",
@@ -582,28 +1121,30 @@ class Tasks(object):
             raise ValueError("output_file is mandatory")
 
         # Prepare the task entry
-        cn = "export_" + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = "cn=%s,%s" % (cn, DN_EXPORT_TASK)
+        cn = f"export_{_task_date()}"
+        dn = f"cn={cn},{DN_EXPORT_TASK}"
         entry = Entry(dn)
-        entry.update({
+        attrs = {
             'objectclass': ['top', 'extensibleObject'],
             'cn': cn,
             'nsFilename': output_file
-        })
+        }
         if benamebase:
-            entry.setValues('nsInstance', benamebase)
+            attrs['nsInstance'] = benamebase
         else:
-            entry.setValues('nsIncludeSuffix', suffix)
+            attrs['nsIncludeSuffix'] = suffix
 
-        if args.get(EXPORT_REPL_INFO, False):
-            entry.setValues('nsExportReplica', 'true')
+        if args and args.get(EXPORT_REPL_INFO, False):
+            attrs['nsExportReplica'] = 'true'
+        entry.update(attrs)
 
         # start the task and possibly wait for task completion
-        self.conn.add_s(entry)
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        if self._submit(entry):
+            self.dn = dn
+            self.entry = entry
+            return 0
+
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error("Error: export task %s for file %s exited with %d",
@@ -638,8 +1179,8 @@ class Tasks(object):
             raise ValueError("You must specify a backup directory.")
 
         # build the task entry
-        cn = "backup_" + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = "cn=%s,%s" % (cn, DN_BACKUP_TASK)
+        cn = f"backup_{_task_date()}"
+        dn = f"cn={cn},{DN_BACKUP_TASK}"
         entry = Entry(dn)
         entry.update({
             'objectclass': ['top', 'extensibleObject'],
@@ -655,10 +1196,7 @@ class Tasks(object):
             self.log.error("Fail to add the backup task (%s)", dn)
             return -1
 
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error("Error: backup task %s exited with %d",
@@ -695,8 +1233,8 @@ class Tasks(object):
             raise ValueError("Backup file (%s) does not exist" % backup_dir)
 
         # build the task entry
-        cn = "restore_" + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = "cn=%s,%s" % (cn, DN_RESTORE_TASK)
+        cn = f"restore_{_task_date()}"
+        dn = f"cn={cn},{DN_RESTORE_TASK}"
         entry = Entry(dn)
         entry.update({
             'objectclass': ['top', 'extensibleObject'],
@@ -712,10 +1250,7 @@ class Tasks(object):
             self.log.error("Fail to add the backup task (%s)", dn)
             return -1
 
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error("Error: restore task %s exited with %d",
@@ -760,26 +1295,9 @@ class Tasks(object):
 
         # If backend name was provided, retrieve the suffix
         if benamebase:
-            ents = self.conn.mappingtree.list(bename=benamebase)
-            if len(ents) != 1:
-                raise ValueError("invalid backend name: %s" % benamebase)
-
-            attr_suffix = MT_PROPNAME_TO_ATTRNAME[MT_SUFFIX]
-            if not ents[0].hasAttr(attr_suffix):
-                raise ValueError(
-                    "invalid backend name: %s, or entry without %s" %
-                    (benamebase, attr_suffix))
-
-            suffix = ensure_str(ents[0].getValue(attr_suffix))
+            suffix = self._resolve_suffix(benamebase)
 
-        backend = None
-        entries_backend = self.conn.backends.list()
-        for be in entries_backend:
-            be_suffix = ensure_str(be.get_attr_val_utf8_l('nsslapd-suffix')).lower()
-            if be_suffix == suffix.lower():
-                backend = be.get_attr_val_utf8_l('cn')
-        if backend is None:
-            raise ValueError("Failed to find backaned matching the suffix")
+        backend = self._resolve_backend(suffix)
 
         attrs = []
         if vlv:
@@ -790,8 +1308,8 @@ class Tasks(object):
                     attrs.append(attr)
             else:
                 attrs.append(attrname)
-            cn = "index_vlv_%s" % (time.strftime("%m%d%Y_%H%M%S", time.localtime()))
-            dn = "cn=%s,%s" % (cn, DN_INDEX_TASK)
+            cn = f"index_vlv_{_task_date()}"
+            dn = f"cn={cn},{DN_INDEX_TASK}"
             entry = Entry(dn)
             entry.update({
                 'objectclass': ['top', 'extensibleObject'],
@@ -804,19 +1322,17 @@ class Tasks(object):
                 #
                 # Reindex all attributes - gather them first...
                 #
-                cn = "index_all_%s" % (time.strftime("%m%d%Y_%H%M%S", time.localtime()))
-                dn = ('cn=%s,cn=ldbm database,cn=plugins,cn=config' % backend)
-                try:
-                    indexes = self.conn.search_s(dn, ldap.SCOPE_SUBTREE, '(objectclass=nsIndex)')
-                    for index in indexes:
-                        attrs.append(ensure_str(index.getValue('cn')))
-                except ldap.LDAPError as e:
-                    raise e
+                cn = f"index_all_{_task_date()}"
+                # The index entries sit right below cn=index of the backend,
+                # and only their names are needed
+                dn = f'cn=index,cn={backend},cn=ldbm database,cn=plugins,cn=config'
+                indexes = self.conn.search_s(dn, ldap.SCOPE_ONELEVEL, '(objectclass=nsIndex)', ['cn'])
+                attrs = [ensure_str(index.getValue('cn')) for index in indexes]
             else:
                 #
                 # Reindex specific attributes
                 #
-                cn = "index_attrs_%s" % (time.strftime("%m%d%Y_%H%M%S", time.localtime()))
+                cn = f"index_attrs_{_task_date()}"
                 if isinstance(attrname, (tuple, list)):
                     # Need to guarantee this is a list (and not a tuple)
                     for attr in attrname:
@@ -824,7 +1340,7 @@ class Tasks(object):
                 else:
                     attrs.append(attrname)
 
-            dn = "cn=%s,%s" % (cn, DN_INDEX_TASK)
+            dn = f"cn={cn},{DN_INDEX_TASK}"
             entry = Entry(dn)
             entry.update({
                 'objectclass': ['top', 'extensibleObject'],
@@ -835,15 +1351,17 @@ class Tasks(object):
 
         # start the task and possibly wait for task completion
         try:
-            self.conn.add_s(entry)
+            queued = self._submit(entry)
         except ldap.ALREADY_EXISTS:
             self.log.error("Fail to add the index task for %s", attrname)
             return -1
 
-        exitCode = 0
-        warningCode = 0
-        if args is not None and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        if queued:
+            self.dn = dn
+            self.entry = entry
+            return 0
+
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error("Error: index task %s exited with %d",
@@ -892,39 +1410,33 @@ class Tasks(object):
 
         # If backend name was provided, retrieve the suffix
         if benamebase:
-            ents = self.conn.mappingtree.list(bename=benamebase)
-            if len(ents) != 1:
-                raise ValueError("invalid backend name: %s" % benamebase)
+            suffix = self._resolve_suffix(benamebase)
 
-            attr = MT_PROPNAME_TO_ATTRNAME[MT_SUFFIX]
-            if not ents[0].hasAttr(attr):
-                raise ValueError(
-                    "invalid backend name: %s, or entry without %s" %
-                    (benamebase, attr))
-
-            suffix = ents[0].getValue(attr)
-
-        cn = "fixupmemberof_" + time.strftime("%m%d%Y_%H%M%S",
-                                              time.localtime())
-        dn = "cn=%s,%s" % (cn, DN_MBO_TASK)
+        cn = f"fixupmemberof_{_task_date()}"
+        dn = f"cn={cn},{DN_MBO_TASK}"
         entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('basedn', suffix)
+        attrs = {
+            'objectclass': ['top', 'extensibleObject'],
+            'cn': cn,
+            'basedn': suffix
+        }
         if filt:
-            entry.setValues('filter', filt)
+            attrs['filter'] = filt
+        entry.update(attrs)
 
         # start the task and possibly wait for task completion
         try:
-            self.conn.add_s(entry)
+            queued = self._submit(entry)
         except ldap.ALREADY_EXISTS:
             self.log.error("Fail to add the memberOf fixup task")
             return -1
 
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        if queued:
+            self.dn = dn
+            self.entry = entry
+            return 0
+
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error(
@@ -962,31 +1474,33 @@ class Tasks(object):
 
         # Verify the backend name
         if bename:
-            ents = self.conn.mappingtree.list(bename=bename)
-            if len(ents) != 1:
-                raise ValueError("invalid backend name: %s" % bename)
+            self._resolve_suffix(bename)
 
-        cn = "fixupTombstone_" + time.strftime("%m%d%Y_%H%M%S",
-                                               time.localtime())
-        dn = "cn=%s,%s" % (cn, DN_TOMB_FIXUP_TASK)
+        cn = f"fixupTombstone_{_task_date()}"
+        dn = f"cn={cn},{DN_TOMB_FIXUP_TASK}"
         entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('backend', bename)
+        attrs = {
+            'objectclass': ['top', 'extensibleObject'],
+            'cn': cn,
+            'backend': bename
+        }
         if args and args.get(TASK_TOMB_STRIP, False):
-            entry.setValues('stripcsn', 'yes')
+            attrs['stripcsn'] = 'yes'
+        entry.update(attrs)
 
         # start the task and possibly wait for task completion
         try:
-            self.conn.add_s(entry)
+            queued = self._submit(entry)
         except ldap.ALREADY_EXISTS:
             self.log.error("Fail to add the fixup tombstone task")
             return -1
 
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        if queued:
+            self.dn = dn
+            self.entry = entry
+            return 0
+
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error(
@@ -1019,15 +1533,17 @@ class Tasks(object):
         @return exit code
         '''
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=automember rebuild membership,cn=tasks,cn=config' % cn)
+        cn = f'task-{_task_date()}'
+        dn = f'cn={cn},cn=automember rebuild membership,cn=tasks,cn=config'
 
         entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('basedn', suffix)
-        entry.setValues('filter', filterstr)
-        entry.setValues('scope', scope)
+        entry.update({
+            'objectclass': ['top', 'extensibleObject'],
+            'cn': cn,
+            'basedn': suffix,
+            'filter': filterstr,
+            'scope': scope
+        })
 
         # start the task and possibly wait for task completion
         try:
@@ -1036,10 +1552,7 @@ class Tasks(object):
             self.log.error("Fail to add Automember Rebuild Membership task")
             return -1
 
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error(
@@ -1075,15 +1588,17 @@ class Tasks(object):
         if not ldif_out:
             raise ValueError("Missing ldif_out")
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=automember export updates,cn=tasks,cn=config' % cn)
+        cn = f'task-{_task_date()}'
+        dn = f'cn={cn},cn=automember export updates,cn=tasks,cn=config'
         entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('basedn', suffix)
-        entry.setValues('filter', fstr)
-        entry.setValues('scope', scope)
-        entry.setValues('ldif', ldif_out)
+        entry.update({
+            'objectclass': ['top', 'extensibleObject'],
+            'cn': cn,
+            'basedn': suffix,
+            'filter': fstr,
+            'scope': scope,
+            'ldif': ldif_out
+        })
 
         # start the task and possibly wait for task completion
         try:
@@ -1092,10 +1607,7 @@ class Tasks(object):
             self.log.error("Fail to add Automember Export Updates task")
             return -1
 
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error(
@@ -1127,14 +1639,16 @@ class Tasks(object):
         if not ldif_out or not ldif_in:
             raise ValueError("Missing ldif_out and/or ldif_in")
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=automember map updates,cn=tasks,cn=config' % cn)
+        cn = f'task-{_task_date()}'
+        dn = f'cn={cn},cn=automember map updates,cn=tasks,cn=config'
 
         entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('ldif_in', ldif_in)
-        entry.setValues('ldif_out', ldif_out)
+        entry.update({
+            'objectclass': ['top', 'extensibleObject'],
+            'cn': cn,
+            'ldif_in': ldif_in,
+            'ldif_out': ldif_out
+        })
 
         # start the task and possibly wait for task completion
         try:
@@ -1143,10 +1657,7 @@ class Tasks(object):
             self.log.error("Fail to add Automember Map Updates task")
             return -1
 
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        exitCode, warningCode = self._wait_task(entry.dn, args)
 
         if exitCode:
             self.log.error(
@@ -1163,49 +1674,105 @@ class Tasks(object):
 
         return exitCode
 
-    def fixupLinkedAttrs(self, linkdn=None, args=None):
-        '''
-        @param linkdn - The DN of linked attr config entry (if None all
-                         possible configurations are checked)
-        @param args - Is a dictionary that contains modifier of the task
-                wait: True/[False] - If True,  waits for the completion
-                                     of the task before to return
-        @return exit code
-        '''
+    def _new_task_cn(self):
+        """Return a name for a new task entry that this object did not
+        issue yet
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=fixup linked attributes,cn=tasks,cn=config' % cn)
-        entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        if linkdn:
-            entry.setValues('linkdn', linkdn)
+        _task_date() names are already unique to this process, so the
+        server is not searched for the names in use.
+        """
+        with self._issued_cns_lock:
+            cn = f'task-{_task_date()}'
+            while cn in self._issued_cns:
+                cn = f'task-{_task_date()}'
+            self._issued_cns.add(cn)
+        return cn
+
+    def _task_modlist(self, name, attrs):
+        """Return the cn, dn and add modlist of a new task entry of the kind
+        'name' (see _TASKS), with every single valued attribute of 'attrs'
+        that is not None"""
+        cn = self._new_task_cn()
+        modlist = [('objectclass', list(_TASK_OBJECTCLASSES)),
+                   ('cn', [cn.encode()])]
+        modlist.extend((k, [ensure_bytes(v)]) for k, v in attrs.items() if v is not None)
+        dn = f'cn={cn},{_TASKS[name][0]}'
+        return cn, dn, modlist
+
+    def collect_acks(self, block=True):
+        """Read the server replies to the task adds sent with the
+        'defer-add' arg, and log the adds that failed
+
+        @param block - If False, only read the replies already received
+        """
+        unacked, self._unacked = self._unacked, []
+        for msgid, label, dn in unacked:
+            try:
+                rtype, _, _, _ = self.conn.result3(msgid, all=1, timeout=-1 if block else 0)
+            except ldap.ALREADY_EXISTS:
+                self.log.error("Fail to add %s task", label)
+            except ldap.LDAPError as e:
+                self.log.error("Fail to add %s task (%s): %s", label, dn, e)
+            else:
+                if rtype is None:
+                    self._unacked.append((msgid, label, dn))
+
+    def _run_task(self, name, attrs, args):
+        """Start a task of the kind 'name' (see _TASKS) with the attributes
+        'attrs', and wait for it if args ask for it
+
+        @return tuple (task dn, and the exit code), the exit code is -1 if
+                the task entry already exists
+        @raise ldap.SERVER_DOWN: If the connection is lost
+        """
+        label = _TASKS[name][1]
+        # If the add fails, do not leave the dn, entry and task of the
+        # previous one for the callers to use
+        self.dn = None
+        self.entry = None
+        self.task = None
+        cn, dn, modlist = self._task_modlist(name, attrs)
+        self.dn = dn
+        self._entry_data = (dn, modlist)
+
+        self.collect_acks(block=False)
+        if args and args.get(TASK_DEFER_ADD, False) and not args.get(TASK_WAIT, False):
+            # Do not wait for the server to acknowledge the add, the reply
+            # is read by a later collect_acks()
+            self._unacked.append((self.conn.add_ext(dn, modlist), label, dn))
+            self.task = Task(self.conn, dn)
+            return (dn, 0)
 
         # start the task and possibly wait for task completion
         try:
-            self.conn.add_s(entry)
+            self.conn.add_ext_s(dn, modlist)
         except ldap.ALREADY_EXISTS:
-            self.log.error("Fail to add Fixup Linked Attributes task")
-            return -1
+            self.log.error("Fail to add %s task", label)
+            return (dn, -1)
 
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+        exitCode, warningCode = self._wait_task(dn, args)
 
         if exitCode:
-            self.log.error(
-                "Error: Fixup Linked Attributes task (%s) exited with %d",
-                cn, exitCode)
+            self.log.error("Error: %s task (%s) exited with %d",
+                           label, cn, exitCode)
         else:
-            self.log.info(
-                "Fixup Linked Attributes task (%s) completed successfully", cn)
+            self.log.info("%s task (%s) completed successfully", label, cn)
         if warningCode:
             self.log.info("with warning code %d", warningCode)
 
-        self.dn = dn
-        self.entry = entry
+        return (dn, exitCode)
 
+    def fixupLinkedAttrs(self, linkdn=None, args=None):
+        '''
+        @param linkdn - The DN of linked attr config entry (if None all
+                         possible configurations are checked)
+        @param args - Is a dictionary that contains modifier of the task
+                wait: True/[False] - If True,  waits for the completion
+                                     of the task before to return
+        @return exit code
+        '''
+
+        _, exitCode = self._run_task('fixupLinkedAttrs', {'linkdn': linkdn or None}, args)
         return exitCode
 
     def schemaReload(self, schemadir=None, args=None):
@@ -1217,37 +1784,7 @@ class Tasks(object):
         @return exit code
         '''
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=schema reload task,cn=tasks,cn=config' % cn)
-        entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        if schemadir:
-            entry.setValues('schemadir', schemadir)
-
-        # start the task and possibly wait for task completion
-        try:
-            self.conn.add_s(entry)
-        except ldap.ALREADY_EXISTS:
-            self.log.error("Fail to add Schema Reload task")
-            return -1
-
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
-
-        if exitCode:
-            self.log.error("Error: Schema Reload task (%s) exited with %d",
-                           cn, exitCode)
-        else:
-            self.log.info("Schema Reload task (%s) completed successfully", cn)
-        if warningCode:
-            self.log.info("with warning code %d", warningCode)
-
-        self.dn = dn
-        self.entry = entry
-
+        _, exitCode = self._run_task('schemaReload', {'schemadir': schemadir or None}, args)
         return exitCode
 
     def fixupWinsyncMembers(self, suffix=DEFAULT_SUFFIX,
@@ -1262,39 +1799,7 @@ class Tasks(object):
         @return exit code
         '''
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=memberuid task,cn=tasks,cn=config' % cn)
-        entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('basedn', suffix)
-        entry.setValues('filter', fstr)
-
-        # start the task and possibly wait for task completion
-        try:
-            self.conn.add_s(entry)
-        except ldap.ALREADY_EXISTS:
-            self.log.error("Fail to add fixupWinsyncMembers 'memberuid task'")
-            return -1
-
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
-
-        if exitCode:
-            self.log.error(
-                "fixupWinsyncMembers 'memberuid task' (%s) exited with %d",
-                cn, exitCode)
-        else:
-            self.log.info(
-                "'memberuid task' (%s) completed successfully", cn)
-        if warningCode:
-            self.log.info("with warning code %d", warningCode)
-
-        self.dn = dn
-        self.entry = entry
-
+        _, exitCode = self._run_task('fixupWinsyncMembers', {'basedn': suffix, 'filter': fstr}, args)
         return exitCode
 
     def syntaxValidate(self, suffix=DEFAULT_SUFFIX, fstr='objectclass=top',
@@ -1309,38 +1814,7 @@ class Tasks(object):
         @return exit code
         '''
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=syntax validate,cn=tasks,cn=config' % cn)
-        entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('basedn', suffix)
-        entry.setValues('filter', fstr)
-
-        # start the task and possibly wait for task completion
-        try:
-            self.conn.add_s(entry)
-        except ldap.ALREADY_EXISTS:
-            self.log.error("Fail to add Syntax Validate task")
-            return -1
-
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
-
-        if exitCode:
-            self.log.error("Error: Syntax Validate (%s) exited with %d",
-                           cn, exitCode)
-        else:
-            self.log.info("Syntax Validate task (%s) completed successfully",
-                          cn)
-        if warningCode:
-            self.log.info("with warning code %d", warningCode)
-
-        self.dn = dn
-        self.entry = entry
-
+        _, exitCode = self._run_task('syntaxValidate', {'basedn': suffix, 'filter': fstr}, args)
         return exitCode
 
     def usnTombstoneCleanup(self, suffix=DEFAULT_SUFFIX, bename=None,
@@ -1356,43 +1830,10 @@ class Tasks(object):
         @return exit code
         '''
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=USN tombstone cleanup task,cn=tasks,cn=config' % cn)
-        entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        if not bename:
-            entry.setValues('suffix', suffix)
-        else:
-            entry.setValues('backend', bename)
+        attrs = {'backend': bename} if bename else {'suffix': suffix}
         if maxusn_to_delete:
-            entry.setValues('maxusn_to_delete')
-
-        # start the task and possibly wait for task completion
-        try:
-            self.conn.add_s(entry)
-        except ldap.ALREADY_EXISTS:
-            self.log.error("Fail to add USN tombstone cleanup task")
-            return -1
-
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
-
-        if exitCode:
-            self.log.error(
-                "Error: USN tombstone cleanup task (%s) exited with %d",
-                cn, exitCode)
-        else:
-            self.log.info(
-                "USN tombstone cleanup task (%s) completed successfully", cn)
-        if warningCode:
-            self.log.info("with warning code %d", warningCode)
-
-        self.dn = dn
-        self.entry = entry
-
+            attrs['maxusn_to_delete'] = str(maxusn_to_delete)
+        _, exitCode = self._run_task('usnTombstoneCleanup', attrs, args)
         return exitCode
 
     def sysconfigReload(self, configfile=None, logchanges=None, args=None):
@@ -1411,38 +1852,10 @@ class Tasks(object):
         if not configfile:
             raise ValueError("Missing required paramter: configfile")
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=sysconfig reload,cn=tasks,cn=config' % cn)
-        entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('sysconfigfile', configfile)
-        if logchanges:
-            entry.setValues('logchanges', logchanges)
-        # start the task and possibly wait for task completion
-        try:
-            self.conn.add_s(entry)
-        except ldap.ALREADY_EXISTS:
-            self.log.error("Fail to add Sysconfig Reload task")
-            return -1
-
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
-
-        if exitCode:
-            self.log.error("Error: Sysconfig Reload task (%s) exited with %d",
-                           cn, exitCode)
-        else:
-            self.log.info("Sysconfig Reload task (%s) completed successfully",
-                          cn)
-        if warningCode:
-            self.log.info("with warning code %d", warningCode)
-
-        self.dn = dn
-        self.entry = entry
-
+        _, exitCode = self._run_task('sysconfigReload',
+                                     {'sysconfigfile': configfile,
+                                      'logchanges': logchanges or None},
+                                     args)
         return exitCode
 
     def cleanAllRUV(self, suffix=None, replicaid=None, force=None, args=None):
@@ -1462,39 +1875,11 @@ class Tasks(object):
         if not suffix:
             raise ValueError("Missing required paramter: suffix")
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=cleanallruv,cn=tasks,cn=config' % cn)
-        entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('replica-base-dn', suffix)
-        entry.setValues('replica-id', replicaid)
-        if force:
-            entry.setValues('replica-force-cleaning', 'yes')
-        # start the task and possibly wait for task completion
-        try:
-            self.conn.add_s(entry)
-        except ldap.ALREADY_EXISTS:
-            self.log.error("Fail to add cleanAllRUV task")
-            return (dn, -1)
-
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
-
-        if exitCode:
-            self.log.error("Error: cleanAllRUV task (%s) exited with %d",
-                           cn, exitCode)
-        else:
-            self.log.info("cleanAllRUV task (%s) completed successfully", cn)
-        if warningCode:
-            self.log.info("with warning code %d", warningCode)
-
-        self.dn = dn
-        self.entry = entry
-
-        return (dn, exitCode)
+        return self._run_task('cleanAllRUV',
+                              {'replica-base-dn': suffix,
+                               'replica-id': replicaid,
+                               'replica-force-cleaning': 'yes' if force else None},
+                              args)
 
     def abortCleanAllRUV(self, suffix=None, replicaid=None, certify=None,
                          args=None):
@@ -1514,44 +1899,11 @@ class Tasks(object):
         if not suffix:
             raise ValueError("Missing required paramter: suffix")
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=abort cleanallruv,cn=tasks,cn=config' % cn)
-        entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('replica-base-dn', suffix)
-        entry.setValues('replica-id', replicaid)
-        if certify:
-            entry.setValues('replica-certify-all', 'yes')
-        else:
-            entry.setValues('replica-certify-all', 'no')
-
-        # start the task and possibly wait for task completion
-        try:
-            self.conn.add_s(entry)
-        except ldap.ALREADY_EXISTS:
-            self.log.error("Fail to add Abort cleanAllRUV task")
-            return (dn, -1)
-
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
-
-        if exitCode:
-            self.log.error(
-                "Error: Abort cleanAllRUV task (%s) exited with %d",
-                cn, exitCode)
-        else:
-            self.log.info(
-                "Abort cleanAllRUV task (%s) completed successfully", cn)
-        if warningCode:
-            self.log.info("with warning code %d", warningCode)
-
-        self.dn = dn
-        self.entry = entry
-
-        return (dn, exitCode)
+        return self._run_task('abortCleanAllRUV',
+                              {'replica-base-dn': suffix,
+                               'replica-id': replicaid,
+                               'replica-certify-all': 'yes' if certify else 'no'},
+                              args)
 
     def upgradeDB(self, nsArchiveDir=None, nsDatabaseType=None,
                   nsForceToReindex=None, args=None):
@@ -1569,42 +1921,301 @@ class Tasks(object):
         if not nsArchiveDir:
             raise ValueError("Missing required paramter: nsArchiveDir")
 
-        cn = 'task-' + time.strftime("%m%d%Y_%H%M%S", time.localtime())
-        dn = ('cn=%s,cn=upgradedb,cn=tasks,cn=config' % cn)
-        entry = Entry(dn)
-        entry.setValues('objectclass', 'top', 'extensibleObject')
-        entry.setValues('cn', cn)
-        entry.setValues('nsArchiveDir', nsArchiveDir)
-        if nsDatabaseType:
-            entry.setValues('nsDatabaseType', nsDatabaseType)
-        if nsForceToReindex:
-            entry.setValues('nsForceToReindex', 'True')
+        _, exitCode = self._run_task('upgradeDB',
+                                     {'nsArchiveDir': nsArchiveDir,
+                                      'nsDatabaseType': nsDatabaseType or None,
+                                      'nsForceToReindex': 'True' if nsForceToReindex else None},
+                                     args)
+        return exitCode
 
-        # start the task and possibly wait for task completion
+    # Coroutine versions of the task methods above.  Every blocking
+    # python-ldap call is made in the event loop executor, and the replies
+    # are polled without blocking, so many tasks can be started and waited
+    # for concurrently on one event loop and one connection.  They do not update self.dn, self.entry and self.task, as
+    # several of them may be in flight at once.
+
+    async def _in_executor(self, func, *args, **kwargs):
+        """Return func(*args, **kwargs), run in the event loop executor"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def _result_async(self, msgid):
+        """Return result3() of an outstanding operation, once the server
+        answered it.
+
+        The reply is polled with a zero timeout instead of waited for in
+        the executor: a blocking result3() holds the python-ldap lock of
+        the connection, and all the other coroutines sharing it would
+        queue up behind it.
+        """
+        intervals = _backoff_intervals(0.001, 2, _ASYNC_POLL_CAP)
+        while True:
+            rtype, rdata, _, _ = self.conn.result3(msgid, all=1, timeout=0)
+            if rtype is not None:
+                return rtype, rdata
+            await asyncio.sleep(next(intervals))
+
+    async def _run_task_async(self, name, attrs, wait, timeout=None):
+        """Coroutine version of _run_task(), waiting for the task if 'wait'
+        is True, for at most 'timeout' seconds (None waits forever)
+
+        @return tuple (task dn, and the exit code, -1 if the task entry
+                already exists). Like _run_task(), the exit code is 0 if
+                the task is still running after 'timeout' seconds, or if it
+                removed its entry before it could be read.
+        """
+        _, dn, modlist = self._task_modlist(name, attrs)
         try:
-            self.conn.add_s(entry)
+            await self._result_async(await self._in_executor(self.conn.add_ext, dn, modlist))
         except ldap.ALREADY_EXISTS:
-            self.log.error("Fail to add upgradedb task")
-            return -1
-
-        exitCode = 0
-        warningCode = 0
-        if args and args.get(TASK_WAIT, False):
-            (done, exitCode, warningCode) = self.conn.tasks.checkTask(entry, True)
+            self.log.error("Fail to add %s task", _TASKS[name][1])
+            return (dn, -1)
+        if not wait:
+            return (dn, 0)
+
+        # Same schedule as checkTask(): back off, but start over whenever
+        # the task makes progress
+        deadline = None if timeout is None else time.monotonic() + timeout
+        intervals = _backoff_intervals(0.05, 1.5, 5.0)
+        current_item = None
+        while True:
+            msgid = await self._in_executor(self.conn.search_ext, dn, ldap.SCOPE_BASE,
+                                            '(objectclass=*)',
+                                            ['nsTaskExitCode', 'nsTaskWarning',
+                                             'nsTaskCurrentItem'])
+            try:
+                _, rdata = await self._result_async(msgid)
+            except ldap.NO_SUCH_OBJECT:
+                rdata = None
+            if not rdata:
+                self.log.debug("complete: task has self cleaned ...")
+                return (dn, 0)
+            task = Entry(rdata[0])
+            if task.nsTaskExitCode:
+                exitCode = int(task.nsTaskExitCode)
+                break
+            remaining = _remaining(deadline)
+            if remaining == 0:
+                self.log.info("%s task (%s) is still running after %ss",
+                              _TASKS[name][1], dn, timeout)
+                return (dn, 0)
+            if task.nsTaskCurrentItem != current_item:
+                current_item = task.nsTaskCurrentItem
+                intervals = _backoff_intervals(0.05, 1.5, 5.0)
+            interval = next(intervals)
+            await asyncio.sleep(interval if remaining < 0 else min(interval, remaining))
 
         if exitCode:
-            self.log.error("Error: upgradedb task (%s) exited with %d",
-                           cn, exitCode)
+            self.log.error("Error: %s task (%s) exited with %d",
+                           _TASKS[name][1], dn, exitCode)
         else:
-            self.log.info("Upgradedb task (%s) completed successfully", cn)
-        if warningCode:
-            self.log.info("with warning code %d", warningCode)
+            self.log.info("%s task (%s) completed successfully",
+                          _TASKS[name][1], dn)
+        if task.nsTaskWarning:
+            self.log.info("with warning code %d", int(task.nsTaskWarning))
+        return (dn, exitCode)
 
-        self.dn = dn
-        self.entry = entry
+    async def fixupLinkedAttrs_async(self, linkdn=None, wait=False, timeout=None):
+        '''coroutine version of fixupLinkedAttrs'''
+        _, exitCode = await self._run_task_async('fixupLinkedAttrs',
+                                                 {'linkdn': linkdn or None}, wait, timeout)
+        return exitCode
+
+    async def schemaReload_async(self, schemadir=None, wait=False, timeout=None):
+        '''coroutine version of schemaReload'''
+        _, exitCode = await self._run_task_async('schemaReload',
+                                                 {'schemadir': schemadir or None}, wait, timeout)
+        return exitCode
+
+    async def fixupWinsyncMembers_async(self, suffix=DEFAULT_SUFFIX,
+                                        fstr='objectclass=top', wait=False, timeout=None):
+        '''coroutine version of fixupWinsyncMembers'''
+        _, exitCode = await self._run_task_async('fixupWinsyncMembers',
+                                                 {'basedn': suffix, 'filter': fstr}, wait, timeout)
+        return exitCode
 
+    async def syntaxValidate_async(self, suffix=DEFAULT_SUFFIX,
+                                   fstr='objectclass=top', wait=False, timeout=None):
+        '''coroutine version of syntaxValidate'''
+        _, exitCode = await self._run_task_async('syntaxValidate',
+                                                 {'basedn': suffix, 'filter': fstr}, wait, timeout)
         return exitCode
 
+    async def usnTombstoneCleanup_async(self, suffix=DEFAULT_SUFFIX, bename=None,
+                                        maxusn_to_delete=None, wait=False, timeout=None):
+        '''coroutine version of usnTombstoneCleanup'''
+        attrs = {'backend': bename} if bename else {'suffix': suffix}
+        if maxusn_to_delete:
+            attrs['maxusn_to_delete'] = str(maxusn_to_delete)
+        _, exitCode = await self._run_task_async('usnTombstoneCleanup', attrs, wait, timeout)
+        return exitCode
+
+    async def sysconfigReload_async(self, configfile=None, logchanges=None, wait=False,
+                                    timeout=None):
+        '''coroutine version of sysconfigReload
+
+        @raise ValueError: If sysconfig file not provided
+        '''
+        if not configfile:
+            raise ValueError("Missing required paramter: configfile")
+        _, exitCode = await self._run_task_async('sysconfigReload',
+                                                 {'sysconfigfile': configfile,
+                                                  'logchanges': logchanges or None},
+                                                 wait, timeout)
+        return exitCode
+
+    async def cleanAllRUV_async(self, suffix=None, replicaid=None, force=None, wait=False,
+                                timeout=None):
+        '''coroutine version of cleanAllRUV
+
+        @return tuple (task dn, and the exit code)
+        @raise ValueError: If missing replicaid or suffix
+        '''
+        if not replicaid:
+            raise ValueError("Missing required paramter: replicaid")
+        if not suffix:
+            raise ValueError("Missing required paramter: suffix")
+        return await self._run_task_async('cleanAllRUV',
+                                          {'replica-base-dn': suffix,
+                                           'replica-id': replicaid,
+                                           'replica-force-cleaning': 'yes' if force else None},
+                                          wait, timeout)
+
+    async def abortCleanAllRUV_async(self, suffix=None, replicaid=None, certify=None,
+                                     wait=False, timeout=None):
+        '''coroutine version of abortCleanAllRUV
+
+        @return tuple (task dn, and the exit code)
+        @raise ValueError: If missing replicaid or suffix
+        '''
+        if not replicaid:
+            raise ValueError("Missing required paramter: replicaid")
+        if not suffix:
+            raise ValueError("Missing required paramter: suffix")
+        return await self._run_task_async('abortCleanAllRUV',
+                                          {'replica-base-dn': suffix,
+                                           'replica-id': replicaid,
+                                           'replica-certify-all': 'yes' if certify else 'no'},
+                                          wait, timeout)
+
+    async def upgradeDB_async(self, nsArchiveDir=None, nsDatabaseType=None,
+                              nsForceToReindex=None, wait=False, timeout=None):
+        '''coroutine version of upgradeDB
+
+        @raise ValueError: If missing nsArchiveDir
+        '''
+        if not nsArchiveDir:
+            raise ValueError("Missing required paramter: nsArchiveDir")
+        _, exitCode = await self._run_task_async('upgradeDB',
+                                                 {'nsArchiveDir': nsArchiveDir,
+                                                  'nsDatabaseType': nsDatabaseType or None,
+                                                  'nsForceToReindex': 'True' if nsForceToReindex else None},
+                                                 wait, timeout)
+        return exitCode
+
+    def run_tasks(self, specs, pool_size=8):
+        '''
+        Run many tasks concurrently, each one on a connection borrowed from
+        the instance task_pool, e.g.:
+
+            tasks.run_tasks([('syntaxValidate', {'suffix': s, 'args': {TASK_WAIT: True}})
+                             for s in suffixes])
+
+        Every spec is checked before the first task is started.  At most
+        'pool_size' tasks are run at once, and at most twice as many are
+        queued.  The number of connections is bounded by the size of
+        task_pool.  If the pool is disabled (DS_TASK_POOL_SIZE=0), all the
+        tasks would share the instance connection and its Tasks, so they
+        are run one after the other instead.
+
+        @param specs - iterable of (method name, keyword arguments) tuples
+        @param pool_size - the number of worker threads
+
+        @return list of the method results, in the order of specs
+        @raise ValueError: If a spec does not name a synchronous task method
+        '''
+        def run(name, kwargs):
+            with self.conn.task_pool.acquire() as conn:
+                return getattr(conn.tasks, name)(**kwargs)
+
+        specs = list(specs)
+        for name, _ in specs:
+            if name not in _RUN_TASKS_METHODS:
+                raise ValueError("Unknown task method: %s" % name)
+        if self.conn.task_pool.size <= 0:
+            return [run(name, kwargs) for name, kwargs in specs]
+
+        slots = threading.BoundedSemaphore(pool_size * 2)
+        futures = []
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            for name, kwargs in specs:
+                slots.acquire()
+                future = executor.submit(run, name, kwargs)
+                future.add_done_callback(lambda f: slots.release())
+                futures.append(future)
+        return [future.result() for future in futures]
+
+    def cleanAllRUV_many(self, items, wait=False, timeout=None):
+        '''
+        Start a cleanAllRUV task for each (suffix, replicaid, force) tuple
+        of 'items' at once, and wait for all of them if 'wait' is True, for
+        at most 'timeout' seconds each (None waits forever).
+        The tasks are run concurrently by cleanAllRUV_async() on this
+        connection.  Must not be called from a running event loop.
+
+        @return list of tuples (task dn, and the exit code), in the order
+                of 'items'
+        @raise ValueError: If an item misses its suffix or replicaid
+        '''
+        items = list(items)
+        for suffix, replicaid, _ in items:
+            if not replicaid or not suffix:
+                raise ValueError("Missing required paramter: suffix or replicaid")
+        return _run_concurrently([self.cleanAllRUV_async(suffix, replicaid, force, wait, timeout)
+                                  for suffix, replicaid, force in items])
+
+    def abortCleanAllRUV_many(self, items, wait=False, timeout=None):
+        '''
+        Start an abort cleanAllRUV task for each (suffix, replicaid, certify)
+        tuple of 'items' at once, like cleanAllRUV_many()
+
+        @return list of tuples (task dn, and the exit code), in the order
+                of 'items'
+        @raise ValueError: If an item misses its suffix or replicaid
+        '''
+        items = list(items)
+        for suffix, replicaid, _ in items:
+            if not replicaid or not suffix:
+                raise ValueError("Missing required paramter: suffix or replicaid")
+        return _run_concurrently([self.abortCleanAllRUV_async(suffix, replicaid, certify,
+                                                              wait, timeout)
+                                  for suffix, replicaid, certify in items])
+
+    def cleanAllRUV_parallel(self, entries, args=None):
+        '''
+        Run a cleanAllRUV task for each (suffix, replicaid, force) tuple of
+        'entries', each one in its own thread and on its own connection from
+        the instance task_pool (see run_tasks()), so that the server cleans
+        the suffixes in parallel instead of one after the other.
+
+        @param args - as for cleanAllRUV(), given to every task
+        @return list of tuples (task dn, and the exit code), in the order
+                of 'entries'
+        @raise ValueError: If an entry misses its suffix or replicaid
+        '''
+        entries = list(entries)
+        if not entries:
+            return []
+        for suffix, replicaid, _ in entries:
+            if not replicaid or not suffix:
+                raise ValueError("Missing required paramter: suffix or replicaid")
+        return self.run_tasks([('cleanAllRUV', {'suffix': suffix,
+                                                'replicaid': replicaid,
+                                                'force': force,
+                                                'args': args})
+                               for suffix, replicaid, force in entries],
+                              pool_size=len(entries))
+
 
 class LDAPIMappingReloadTask(Task):
     """LDAPI DN Mapping task entry
@@ -1614,6 +2225,6 @@ class LDAPIMappingReloadTask(Task):
     """
 
     def __init__(self, instance, dn=None):
-        self.cn = 'reload-' + Task._get_task_date()
+        self.cn = f'reload-{Task._get_task_date()}'
         dn = f'cn={self.cn},cn=reload ldapi mappings,cn=tasks,cn=config'
         super(LDAPIMappingReloadTask, self).__init__(instance, dn)